@@ -5,21 +5,26 @@ dry-run operations.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import uuid
-from copy import deepcopy
+from itertools import islice
 from typing import (
     TYPE_CHECKING,
     Any,
     AsyncIterator,
     Dict,
+    Iterable,
     Iterator,
     List,
     Optional,
     Type,
+    TypeVar,
     Union,
 )
 
+from algoliasearch.configs import SearchConfig
+from algoliasearch.exceptions import RequestException
 from algoliasearch.search_client import SearchClient
 
 if TYPE_CHECKING:
@@ -33,6 +38,19 @@ AlgoliaIndexType = Union["SearchIndexAsync", "MockAlgoliaIndex"]
 `MockAlgoliaIndex` context managers.
 """
 
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 1000
+"""Default number of objects sent to Algolia in a single batch request."""
+
+DEFAULT_MAX_IN_FLIGHT = 8
+"""Default number of batch requests that are concurrently sent to Algolia."""
+
+DEFAULT_MAX_RETRIES = 5
+"""Default number of times a rate-limited batch request is retried."""
+
 
 class BaseAlgoliaIndex:
     """Base class for an Algolia index client.
@@ -45,12 +63,23 @@ class BaseAlgoliaIndex:
         The Algolia application ID.
     name : str
         Name of the Algolia index.
+    batch_size : int, optional
+        Number of objects sent to Algolia in each batch request by
+        ``save_objects``-type methods.
     """
 
-    def __init__(self, *, key: str, app_id: str, name: str):
+    def __init__(
+        self,
+        *,
+        key: str,
+        app_id: str,
+        name: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
         self._key = key
         self._app_id = app_id
         self._index_name = name
+        self._batch_size = batch_size
         self._logger = logging.getLogger(__name__)
 
     @property
@@ -63,6 +92,11 @@ class BaseAlgoliaIndex:
         """The Algolia application ID."""
         return self._app_id
 
+    @property
+    def batch_size(self) -> int:
+        """Number of objects sent to Algolia in each batch request."""
+        return self._batch_size
+
 
 class AlgoliaIndex(BaseAlgoliaIndex):
     """An Algolia index client.
@@ -78,13 +112,37 @@ class AlgoliaIndex(BaseAlgoliaIndex):
         The Algolia application ID.
     name : str
         Name of the Algolia index.
+    batch_size : int, optional
+        Number of objects sent to Algolia in each batch request by
+        ``save_objects``-type methods.
     """
 
+    def __init__(
+        self,
+        *,
+        key: str,
+        app_id: str,
+        name: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        super().__init__(
+            key=key, app_id=app_id, name=name, batch_size=batch_size
+        )
+        # Number of open contexts sharing the client (see __aenter__).
+        self._client_users = 0
+
     async def __aenter__(self) -> SearchIndexAsync:
-        self._logger.debug("Opening algolia client")
-        self.algolia_client = SearchClient.create(self.app_id, self._key)
-        self._logger.debug("Initializing algolia index")
-        self.index = self.algolia_client.init_index(self.name)
+        # The client, and its pool of HTTP connections, is shared if the
+        # context manager is re-entered. The client is closed once the
+        # outermost context exits.
+        if self._client_users == 0:
+            self._logger.debug("Opening algolia client")
+            config = SearchConfig(self.app_id, self._key)
+            config.batch_size = self.batch_size
+            self.algolia_client = SearchClient.create_with_config(config)
+            self._logger.debug("Initializing algolia index")
+            self.index = self.algolia_client.init_index(self.name)
+        self._client_users += 1
         return self.index
 
     async def __aexit__(
@@ -93,6 +151,9 @@ class AlgoliaIndex(BaseAlgoliaIndex):
         exc: Optional[Exception],
         tb: Optional[TracebackType],
     ) -> None:
+        self._client_users -= 1
+        if self._client_users > 0:
+            return
         self._logger.debug("Closing algolia client")
         await self.algolia_client.close_async()
         self._logger.debug("Finished closing algolia client")
@@ -113,6 +174,8 @@ class MockAlgoliaIndex(BaseAlgoliaIndex):
         The Algolia application ID.
     index : str
         Name of the Algolia index.
+    batch_size : int, optional
+        Number of objects in each (mock) batch request.
     """
 
     async def __aenter__(self) -> "MockAlgoliaIndex":
@@ -133,10 +196,18 @@ class MockAlgoliaIndex(BaseAlgoliaIndex):
         objects: Union[List[Dict], Iterator[Dict]],
         request_options: Optional[Dict[str, Any]] = None,
     ) -> MockMultiResponse:
-        """Mock implementation of save_objects_async."""
-        for obj in objects:
-            self._saved_objects.append(deepcopy(obj))
-        return MockMultiResponse()
+        """Mock implementation of save_objects_async.
+
+        Objects are consumed in batches of `batch_size`, mirroring how the
+        Algolia client chunks objects into batch requests.
+        """
+        raw_responses: List[Dict[str, Any]] = []
+        for batch in _chunked(objects, self.batch_size):
+            self._saved_objects.extend(_copy_object(obj) for obj in batch)
+            raw_responses.append(
+                {"objectIDs": [obj["objectID"] for obj in batch]}
+            )
+        return MockMultiResponse(raw_responses=raw_responses)
 
     async def browse_objects_async(
         self, search_settings: Dict[str, Any]
@@ -148,19 +219,162 @@ class MockAlgoliaIndex(BaseAlgoliaIndex):
         for _ in range(5):
             yield {}
 
-    async def delete_objects_async(self, objectids: List[str]) -> List[str]:
-        return objectids
+    async def delete_objects_async(
+        self, objectids: List[str]
+    ) -> MockMultiResponse:
+        """Mock implementation of delete_objects_async."""
+        return MockMultiResponse(raw_responses=[{"objectIDs": objectids}])
 
 
 class MockMultiResponse:
     """Mock of an algolia resonse."""
 
+    __slots__ = ("raw_responses",)
+
+    def __init__(
+        self, raw_responses: Optional[List[Dict[str, Any]]] = None
+    ) -> None:
+        self.raw_responses = raw_responses if raw_responses else []
+
+
+async def save_objects_concurrent(
+    index: AlgoliaIndexType,
+    objects: Iterable[Dict[str, Any]],
+    *,
+    batch_size: Optional[int] = None,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+) -> List[str]:
+    """Save objects to an Algolia index with several batch requests in
+    flight at once.
+
+    Parameters
+    ----------
+    index
+        Algolia index created by the `AlgoliaIndex` or `MockAlgoliaIndex`
+        context managers.
+    objects
+        The objects to save.
+    batch_size : int, optional
+        Number of objects in each batch request. If `None`, the index's
+        batch size (set with the ``batch_size`` parameter of `AlgoliaIndex`
+        or `MockAlgoliaIndex`) is used.
+    max_in_flight : int, optional
+        Maximum number of batch requests that are concurrently awaited.
+    max_retries : int, optional
+        Number of times a batch request is retried, with exponential backoff,
+        if Algolia responds that the request is rate limited (status 429).
+
+    Returns
+    -------
+    object_ids : `list` of `str`
+        The objectIDs of saved objects. The order of objectIDs may differ
+        from the order of ``objects``.
+
+    Raises
+    ------
+    algoliasearch.exceptions.RequestException
+        Raised if a batch request fails (after any retries). No new batch
+        requests are started after a failure, but other batch requests that
+        are already in flight are allowed to finish before the exception is
+        raised.
+
+    Notes
+    -----
+    Batches are drawn lazily from ``objects`` by ``max_in_flight`` workers,
+    so ``objects`` can be a generator and no more than
+    ``max_in_flight * batch_size`` objects are held in memory at once.
+    """
+    if batch_size is None:
+        batch_size = _get_index_batch_size(index)
+    batches = _chunked(objects, batch_size)
+
+    async def save_batch(batch: List[Dict[str, Any]]) -> List[str]:
+        attempt = 0
+        while True:
+            try:
+                response = await index.save_objects_async(batch)
+            except RequestException as e:
+                if e.status_code != 429 or attempt >= max_retries:
+                    raise
+                delay = 2**attempt
+                logger.warning(
+                    "Algolia rate limit reached; retrying in %d s", delay
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            break
+        object_ids: List[str] = []
+        for raw_response in response.raw_responses:
+            object_ids.extend(raw_response.get("objectIDs", []))
+        return object_ids
+
+    failed = False
+
+    async def worker() -> List[str]:
+        # Workers share the batches iterator; each batch is drawn by exactly
+        # one worker because the event loop runs workers one at a time.
+        nonlocal failed
+        object_ids: List[str] = []
+        while not failed:
+            batch = next(batches, None)
+            if batch is None:
+                break
+            try:
+                object_ids.extend(await save_batch(batch))
+            except BaseException:
+                # Stop the other workers from drawing more batches
+                failed = True
+                raise
+        return object_ids
+
+    results = await asyncio.gather(
+        *[worker() for _ in range(max_in_flight)],
+        return_exceptions=True,
+    )
+    saved_object_ids: List[str] = []
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+        saved_object_ids.extend(result)
+    return saved_object_ids
+
+
+def _get_index_batch_size(index: AlgoliaIndexType) -> int:
+    """Get the batch size that an index is configured with."""
+    if isinstance(index, MockAlgoliaIndex):
+        return index.batch_size
+    # AlgoliaIndex sets the batch size on the SearchIndexAsync's config
+    return index._config.batch_size
+
+
+def _copy_object(obj: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy an Algolia object, including its list and dict values.
+
+    Algolia objects are JSON-like records whose values are primitives or
+    shallow containers, so copying one level deep is enough to isolate the
+    copy from the original, without the overhead of `copy.deepcopy`.
+    """
+    return {
+        key: value.copy() if isinstance(value, (list, dict)) else value
+        for key, value in obj.items()
+    }
+
+
+def _chunked(iterable: Iterable[T], n: int) -> Iterator[List[T]]:
+    """Iterate over lists of (up to) ``n`` items from an iterable."""
+    iterator = iter(iterable)
+    return iter(lambda: list(islice(iterator, n)), [])
+
+
+_FACET_ESCAPES = str.maketrans({'"': r"\"", "'": r"\'"})
+"""Translation table for escaping quotes in facet values."""
+
 
 def escape_facet_value(value: str) -> str:
     """Escape and quote a facet value for an Algolia search."""
-    value = value.replace('"', r"\"").replace("'", r"\'")
-    value = f'"{value}"'
-    return value
+    return f'"{value.translate(_FACET_ESCAPES)}"'
 
 
 def generate_index_epoch() -> str:
@@ -3,20 +3,44 @@
 
 from __future__ import annotations
 
-__all__ = ["ContentType", "AlgoliaRecord", "TutorialRecord", "GuideRecord"]
+__all__ = [
+    "ContentType",
+    "AlgoliaRecord",
+    "TutorialRecord",
+    "GuideRecord",
+    "TUTORIAL_KEYWORD_GROUPS",
+    "HEADING_FIELDS",
+    "generate_date_indexed",
+    "validate_index_epoch",
+]
 
-import copy
 import datetime
 import json
 import math
-import re
 from base64 import b64encode
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
-from urllib.parse import urlparse, urlunparse
-
-from more_itertools import chunked
-from pydantic import UUID4, BaseModel, Field, HttpUrl, validator
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Type,
+    TypeVar,
+)
+from uuid import UUID
+
+from pydantic import UUID4, BaseModel, Field, HttpUrl
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 if TYPE_CHECKING:
     from astropylibrarian.keywords import KeywordDb
@@ -28,6 +52,153 @@ if TYPE_CHECKING:
     from astropylibrarian.reducers.utils import Section
 
 
+AlgoliaRecordType = TypeVar("AlgoliaRecordType", bound="AlgoliaRecord")
+
+TUTORIAL_KEYWORD_GROUPS = (
+    "astropy_package",
+    "python_package",
+    "task",
+    "science",
+)
+"""Keyword groups (see `astropylibrarian.keywords.KeywordDb`) that are
+included in tutorial records.
+"""
+
+HEADING_FIELDS = ("h1", "h2", "h3", "h4", "h5", "h6")
+"""Record fields for each level of a section's heading hierarchy."""
+
+
+def validate_index_epoch(index_epoch: str) -> str:
+    """Validate an ``index_epoch`` value, which must be a UUID4 string.
+
+    Records are built without validation (see
+    `AlgoliaRecord.construct_trusted`), so validate the ``index_epoch`` once
+    per indexing run, before building the run's records.
+
+    Parameters
+    ----------
+    index_epoch : str
+        The index epoch, as generated by
+        `astropylibrarian.algolia.client.generate_index_epoch`.
+
+    Returns
+    -------
+    str
+        The index epoch, in the canonical hyphenated UUID format.
+
+    Raises
+    ------
+    ValueError
+        Raised if ``index_epoch`` is not a UUID4 string.
+    """
+    try:
+        uuid = UUID(index_epoch)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"index_epoch {index_epoch!r} is not a UUID") from e
+    if uuid.version != 4:
+        raise ValueError(f"index_epoch {index_epoch!r} is not a UUID4")
+    return str(uuid)
+
+
+def generate_date_indexed() -> datetime.datetime:
+    """Generate a new value for the ``date_indexed`` field of records: the
+    current UTC time.
+
+    The timestamp is a naive datetime (without ``tzinfo``) so that records
+    serialize it in the same ISO 8601 format, without a UTC offset, as
+    earlier versions did with `datetime.datetime.utcnow`.
+    """
+    return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+
+def _json_dumps(
+    value: Any,
+    *,
+    default: Optional[Callable[[Any], Any]] = None,
+    **kwargs: Any,
+) -> str:
+    """Serialize a value to a JSON string, using orjson when it is
+    installed.
+
+    Formatting keyword arguments (such as ``indent`` or ``sort_keys``, which
+    pydantic passes through from ``json`` and ``schema_json``) are handled by
+    `json.dumps`, since orjson doesn't support them.
+    """
+    if HAS_ORJSON and not kwargs:
+        return orjson.dumps(value, default=default).decode("utf-8")
+    return json.dumps(value, default=default, **kwargs)
+
+
+def _json_size(value: Any) -> int:
+    """Measure the size, in bytes, of a value serialized as UTF-8 JSON."""
+    if HAS_ORJSON:
+        # orjson serializes directly to UTF-8 bytes
+        return len(orjson.dumps(value))
+    # Match orjson's compact, non-ASCII-escaping output so that records are
+    # split the same way with or without orjson
+    return len(
+        json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode(
+            "utf-8"
+        )
+    )
+
+
+def _json_loads(data: str) -> Any:
+    """Deserialize a JSON string, using orjson when it is installed."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _to_json_compatible(value: Any) -> Any:
+    """Coerce a value from ``BaseModel.dict`` into a JSON-compatible type.
+
+    UUIDs and URLs become plain strings, datetimes become ISO 8601 strings,
+    and enums become their values. Lists and dicts are converted
+    recursively.
+    """
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, str):
+        # Covers str subclasses such as pydantic's HttpUrl
+        return str(value)
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    if isinstance(value, list):
+        return [_to_json_compatible(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _to_json_compatible(v) for k, v in value.items()}
+    return value
+
+
+def _pack_sentences(sentences: List[str], budget: int) -> Iterator[List[str]]:
+    """Group consecutive sentences into chunks whose content, once joined
+    with ``". "`` and serialized as a JSON string, fits within a byte
+    budget.
+
+    A sentence that is larger than the budget on its own is yielded as a
+    chunk by itself.
+    """
+    # Both the quotes around the JSON string and the ". " separator between
+    # sentences are two bytes.
+    chunk: List[str] = []
+    chunk_bytes = 2
+    for sentence in sentences:
+        sentence_bytes = _json_size(sentence) - 2
+        if chunk and chunk_bytes + 2 + sentence_bytes > budget:
+            yield chunk
+            chunk = []
+            chunk_bytes = 2
+        if chunk:
+            chunk_bytes += 2
+        chunk.append(sentence)
+        chunk_bytes += sentence_bytes
+    if chunk:
+        yield chunk
+
+
 class ContentType(str, Enum):
     """Learn Astropy content types."""
 
@@ -43,6 +214,13 @@ class ContentType(str, Enum):
 class AlgoliaRecord(BaseModel):
     """A Pydantic model for a Learn Astropy record in Algolia."""
 
+    class Config:
+        json_dumps = _json_dumps
+        json_loads = _json_loads
+        # Records are write-once values; derived records (such as from
+        # split) are created as copies.
+        allow_mutation = False
+
     objectID: str = Field(description="Unique identifier for this record.")
 
     index_epoch: UUID4 = Field(
@@ -113,7 +291,7 @@ class AlgoliaRecord(BaseModel):
 
     date_indexed: datetime.datetime = Field(
         description="Timestamp when the record was indexed.",
-        default_factory=datetime.datetime.utcnow,
+        default_factory=generate_date_indexed,
     )
 
     thumbnail_url: Optional[HttpUrl] = Field(
@@ -126,6 +304,32 @@ class AlgoliaRecord(BaseModel):
         "default search (before a user enters a search term).",
     )
 
+    @classmethod
+    def construct_trusted(
+        cls: Type[AlgoliaRecordType], **data: Any
+    ) -> AlgoliaRecordType:
+        """Create a record from trusted data, without validation.
+
+        Use this constructor for records built from data that is produced
+        by this package's reducers, which is already validated where it
+        enters the system (for example, URLs are resolved against the
+        page's URL). Skipping validation avoids re-parsing every URL, UUID,
+        and enum for each record.
+
+        Parameters
+        ----------
+        **data
+            Field values, keyed by field name. Fields that are not set take
+            their default values.
+
+        Returns
+        -------
+        AlgoliaRecord
+            The record (an instance of the class that this method is called
+            on).
+        """
+        return cls.construct(**data)
+
     @staticmethod
     def compute_object_id_for_section(section: Section) -> str:
         """Compute an Algolia ``objectID`` given a content section.
@@ -140,12 +344,13 @@ class AlgoliaRecord(BaseModel):
         str
             The ``objectID`` for an Algolia record.
         """
+        # base64 output is always ASCII, so use the faster ASCII decoder
         url_component = b64encode(section.url.lower().encode("utf-8")).decode(
-            "utf-8"
+            "ascii"
         )
         heading_component = b64encode(
             " ".join(section.headings).encode("utf-8")
-        ).decode("utf-8")
+        ).decode("ascii")
         return f"{url_component}-{heading_component}"
 
     def export_to_algolia(self) -> Dict[str, Any]:
@@ -157,15 +362,15 @@ class AlgoliaRecord(BaseModel):
 
         Notes
         -----
-        This method:
-
-        1. Serializes to JSON so that all types are JSON-compatible. It also
-           applies the exclude_none argument to pydantic ``BaseModel.json``
-           method.
-        2. Deserializes the JSON into a dict
+        The model is converted to a dict, excluding `None` values, and then
+        each value is coerced to a JSON-compatible type in a single pass (see
+        `_to_json_compatible`). This is equivalent to, but faster than,
+        round-tripping the record through a JSON string.
         """
-        json_data = self.json(exclude_none=True)
-        return json.loads(json_data)
+        return {
+            k: _to_json_compatible(v)
+            for k, v in self.dict(exclude_none=True).items()
+        }
 
     def export_capped_records_to_algolia(
         self, max_size: int = 9500
@@ -187,39 +392,59 @@ class AlgoliaRecord(BaseModel):
             split across multiple sub-records that fit within the size cap.
             Each sub-record has an integer suffix added to the ``objectID``.
         """
-        json_record = self.export_to_algolia()
-        total_bytes = len(json.dumps(json_record).encode("utf-8"))
+        # Export once, both to measure the record size and as the template
+        # for any sub-records.
+        record = self.export_to_algolia()
+        total_bytes = _json_size(record)
 
         if total_bytes < max_size:
-            yield json_record
+            yield record
 
         else:
-            # split content by sentences.
-            content_chunks = re.split(r"\. ", self.content)
-            split_by = math.ceil(total_bytes / max_size)
-            part_size = math.floor(len(content_chunks) / split_by)
-            for i, chunk in enumerate(chunked(content_chunks, part_size), 1):
-                sub_record = copy.deepcopy(self)
-                sub_record.content = ". ".join(chunk)
-                # patch the object ID with a chunk number suffix
-                sub_record.objectID = f"{self.objectID}-{i}"
-                yield sub_record.export_to_algolia()
-
-    def split(self, number: int) -> List[AlgoliaRecord]:
+            # Split the content by sentences, and pack sentences into chunks
+            # by their serialized size. The byte budget for each chunk's
+            # content is what remains of the cap after the rest of the
+            # record (the "envelope"), including the longest possible
+            # objectID suffix.
+            sentences = self.content.split(". ")
+            envelope_bytes = total_bytes - _json_size(self.content)
+            suffix_bytes = len(f"-{len(sentences)}")
+            budget = max_size - 1 - envelope_bytes - suffix_bytes
+            chunks = _pack_sentences(sentences, budget)
+            # Sub-record objectIDs have a chunk number suffix
+            id_prefix = self.objectID + "-"
+            for i, chunk in enumerate(chunks, 1):
+                # All other exported values are immutable or shared
+                # read-only, so a shallow copy of the exported object is
+                # enough for each sub-record.
+                yield dict(
+                    record,
+                    content=". ".join(chunk),
+                    objectID=id_prefix + str(i),
+                )
+
+    def split(self, number: int) -> Iterator[AlgoliaRecord]:
         """Split a record in a given number of parts; evenly distributing
         the content between parts.
+
+        Parts are yielded one at a time, so they don't all need to be held
+        in memory at once.
         """
-        p = re.compile(r"\. ")
-        content_chunks = p.split(self.content)
-        part_size = math.floor(len(content_chunks) / number)
-        split_records: List[AlgoliaRecord] = []
-        for i, chunk in enumerate(chunked(content_chunks, part_size), 1):
-            new_record = copy.deepcopy(self)
-            new_record.content = ". ".join(chunk)
-            # patch the object ID with a chunk number suffix
-            new_record.objectID = f"{self.objectID}-{i}"
-            split_records.append(new_record)
-        return split_records
+        content_chunks = self.content.split(". ")
+        part_size = max(1, math.floor(len(content_chunks) / number))
+        # Split record objectIDs have a chunk number suffix
+        id_prefix = self.objectID + "-"
+        for i, start in enumerate(range(0, len(content_chunks), part_size), 1):
+            end = start + part_size
+            chunk = content_chunks[start:end]
+            # A shallow copy is enough since the other fields are not
+            # modified; the copies share their list values with this record.
+            yield self.copy(
+                update={
+                    "content": ". ".join(chunk),
+                    "objectID": id_prefix + str(i),
+                }
+            )
 
 
 class TutorialRecord(AlgoliaRecord):
@@ -244,17 +469,9 @@ class TutorialRecord(AlgoliaRecord):
     )
 
     content_type: ContentType = Field(
-        description="Content type.", default=ContentType.tutorial
+        description="Content type.", default=ContentType.tutorial, const=True
     )
 
-    @validator("content_type")
-    def validate_content_type(cls, v: Optional[str]) -> str:
-        if v is None:
-            return ContentType.tutorial
-        elif v != ContentType.tutorial:
-            raise ValueError("Content type must be `tutorial`.")
-        return v
-
     @classmethod
     def from_section(
         cls,
@@ -264,6 +481,9 @@ class TutorialRecord(AlgoliaRecord):
         keyworddb: KeywordDb,
         index_epoch: str,
         priority: int,
+        keyword_groups: Optional[Mapping[str, List[str]]] = None,
+        base_url: Optional[str] = None,
+        date_indexed: Optional[datetime.datetime] = None,
     ) -> TutorialRecord:
         """Create a TutorialRecord from a reduced tutorial HTML page and
         specific section.
@@ -279,17 +499,36 @@ class TutorialRecord(AlgoliaRecord):
             The keyword database to sort keywords in tutorials into
             categories for the Learn Astropy UI.
         index_epoch
-            A unique identifier for the indexing run.
+            A unique identifier for the indexing run. This must already be
+            validated with `validate_index_epoch` since the record is built
+            without validation.
         priority : int
             A priority level that elevates a tutorial in the UI's default
             sorting.
+        keyword_groups : dict, optional
+            The tutorial's keywords, already sorted into groups with
+            `astropylibrarian.reducers.tutorial.ReducedTutorial.classify_keywords`.
+            Pass this when creating records for many sections of the same
+            tutorial so that keywords are only classified once. If `None`,
+            the keywords are classified with ``keyworddb``.
+        base_url : str, optional
+            The tutorial's base URL, as computed by `compute_base_url`. Pass
+            this when creating records for many sections of the same
+            tutorial so that the URL is only computed once. If `None`, it is
+            computed from ``tutorial``.
+        date_indexed : datetime.datetime, optional
+            Timestamp of the indexing run. Pass the same timestamp for all
+            records of a run. If `None`, the current time is used.
 
         Returns
         -------
         TutorialRecord
             A tutorial record, ready to index in Algolia.
         """
-        base_url = cls.compute_base_url(tutorial=tutorial)
+        if keyword_groups is None:
+            keyword_groups = tutorial.classify_keywords(keyworddb)
+        if base_url is None:
+            base_url = cls.compute_base_url(tutorial=tutorial)
         kwargs: Dict[str, Any] = {
             "objectID": cls.compute_object_id_for_section(section),
             "index_epoch": index_epoch,
@@ -301,56 +540,49 @@ class TutorialRecord(AlgoliaRecord):
             "importance": section.header_level,
             "content": section.content,
             "authors": tutorial.authors,
-            "astropy_package_keywords": keyworddb.filter_keywords(
-                tutorial.keywords, "astropy_package"
-            ),
-            "python_package_keywords": keyworddb.filter_keywords(
-                tutorial.keywords, "python_package"
-            ),
-            "task_keywords": keyworddb.filter_keywords(
-                tutorial.keywords, "task"
-            ),
-            "science_keywords": keyworddb.filter_keywords(
-                tutorial.keywords, "science"
-            ),
+            "astropy_package_keywords": keyword_groups["astropy_package"],
+            "python_package_keywords": keyword_groups["python_package"],
+            "task_keywords": keyword_groups["task"],
+            "science_keywords": keyword_groups["science"],
             "priority": priority,
+            **dict(zip(HEADING_FIELDS, section.headings)),
         }
-        for i, heading in enumerate(section.headings):
-            kwargs[f"h{i+1}"] = heading
         if tutorial.images:
             # TODO consider an explicitly set thumbnail from tutorial metadata
             kwargs["thumbnail_url"] = tutorial.images[0]
+        if date_indexed is not None:
+            kwargs["date_indexed"] = date_indexed
 
-        return cls(**kwargs)
+        return cls.construct_trusted(**kwargs)
 
     @staticmethod
     def compute_base_url(*, tutorial: ReducedTutorial) -> str:
         """The base URL of the tutorial that the section belongs to.
 
         This is the section's ``url`` attribute stripped of the fragment
-        (``#id`` part).
+        (``#id`` part) and query (``?key=value`` part).
+
+        Examples
+        --------
+        >>> from types import SimpleNamespace
+        >>> tutorial = SimpleNamespace(
+        ...     url="https://learn.astropy.org/tutorials/FITS-images.html?a#c"
+        ... )
+        >>> TutorialRecord.compute_base_url(tutorial=tutorial)
+        'https://learn.astropy.org/tutorials/FITS-images.html'
         """
-        url_parts = urlparse(tutorial.url)
-        return urlunparse(
-            (url_parts.scheme, url_parts.netloc, url_parts.path, "", "", "")
-        )
+        # Partitioning is equivalent to a urlparse/urlunparse round trip
+        # for the http(s) URLs of tutorials, and much cheaper.
+        return tutorial.url.partition("#")[0].partition("?")[0]
 
 
 class GuideRecord(AlgoliaRecord):
     """A Pydantic model of a "guide" content type record."""
 
     content_type: ContentType = Field(
-        description="Content type.", default=ContentType.guide
+        description="Content type.", default=ContentType.guide, const=True
     )
 
-    @validator("content_type")
-    def validate_content_type(cls, v: Optional[str]) -> str:
-        if v is None:
-            return ContentType.guide
-        elif v != ContentType.guide:
-            raise ValueError("Content type must be `guide`.")
-        return v
-
     @classmethod
     def from_section(
         cls,
@@ -359,6 +591,7 @@ class GuideRecord(AlgoliaRecord):
         page: JupyterBookPage,
         section: Section,
         index_epoch: str,
+        date_indexed: Optional[datetime.datetime] = None,
     ) -> GuideRecord:
         if page.image_urls:
             # TODO consider getting a thumbnail explicitly set form guide
@@ -391,7 +624,8 @@ class GuideRecord(AlgoliaRecord):
             "content": section.content,
             "thumbnail_url": thumbnail_url,
             "priority": site_metadata.priority,
+            **dict(zip(HEADING_FIELDS, section.headings)),
         }
-        for i, heading in enumerate(section.headings):
-            kwargs[f"h{i+1}"] = heading
-        return cls(**kwargs)
+        if date_indexed is not None:
+            kwargs["date_indexed"] = date_indexed
+        return cls.construct_trusted(**kwargs)
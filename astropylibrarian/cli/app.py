@@ -3,15 +3,20 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 
 import typer
 
 from astropylibrarian.algolia.client import AlgoliaIndex
 from astropylibrarian.cli import index
+from astropylibrarian.cli.utils import run_async
 from astropylibrarian.workflows.deleterooturl import delete_root_url
 
+LOG_HANDLER_NAME = "astropylibrarian.cli"
+"""Name of the logging handler that the CLI adds to the astropylibrarian
+logger.
+"""
+
 app = typer.Typer(
     short_help="Manage the content indexed by the Learn Astropy project."
 )
@@ -55,12 +60,20 @@ def main_callback(
     else:
         log_format = "%(levelname)s: %(message)s"
 
-    handler = logging.StreamHandler()
+    logger = logging.getLogger("astropylibrarian")
+    # Reuse the CLI's handler if the callback already ran in this process
+    # (for example, if the CLI is invoked several times from Python) so that
+    # log messages aren't emitted once per invocation.
+    for handler in logger.handlers:
+        if handler.get_name() == LOG_HANDLER_NAME:
+            break
+    else:
+        handler = logging.StreamHandler()
+        handler.set_name(LOG_HANDLER_NAME)
+        logger.addHandler(handler)
     handler.setFormatter(
         logging.Formatter(log_format, datefmt="%Y-%m-%d:%H:%M:%S")
     )
-    logger = logging.getLogger("astropylibrarian")
-    logger.addHandler(handler)
     logger.setLevel(logging_level)
 
 
@@ -83,8 +96,7 @@ def delete(
     ),
 ) -> None:
     """Delete Algolia records."""
-    event_loop = asyncio.get_event_loop()
-    event_loop.run_until_complete(
+    run_async(
         run_delete(
             url=url,
             algolia_id=algolia_id,
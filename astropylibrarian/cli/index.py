@@ -4,13 +4,16 @@
 from __future__ import annotations
 
 import asyncio
-from pathlib import Path, PosixPath
-from typing import Awaitable, List, Optional
+import os
+from pathlib import Path, PurePath
+from typing import Iterator, List, Optional, Tuple
 
-import aiohttp
 import typer
 
 from astropylibrarian.algolia.client import AlgoliaIndex
+from astropylibrarian.algolia.records import generate_date_indexed
+from astropylibrarian.cli.utils import run_async
+from astropylibrarian.workflows.download import make_http_client
 from astropylibrarian.workflows.indexjupyterbook import index_jupyterbook
 from astropylibrarian.workflows.indextutorial import (
     index_tutorial_from_path,
@@ -46,8 +49,7 @@ def tutorial(
     ),
 ) -> None:
     """Index a single tutorial."""
-    event_loop = asyncio.get_event_loop()
-    event_loop.run_until_complete(
+    run_async(
         run_index_tutorial(
             url=url,
             algolia_id=algolia_id,
@@ -86,6 +88,9 @@ def tutorial_site(
             "file is always excluded."
         ),
     ),
+    concurrency: int = typer.Option(
+        8, help="Maximum number of tutorials to index concurrently."
+    ),
 ) -> None:
     """Index a directory of tutorial HTML files.
 
@@ -95,8 +100,7 @@ def tutorial_site(
     each HTML file as a tutorial, except for those with paths specified in
     the --ignore argument. The root index.html file is always ignored.
     """
-    event_loop = asyncio.get_event_loop()
-    event_loop.run_until_complete(
+    run_async(
         run_index_tutorial_site(
             site_dir=site_dir,
             root_url=url,
@@ -104,6 +108,7 @@ def tutorial_site(
             algolia_key=algolia_key,
             index=index,
             ignore_paths=ignore,
+            concurrency=concurrency,
         )
     )
 
@@ -116,34 +121,63 @@ async def run_index_tutorial_site(
     algolia_key: str,
     index: str,
     ignore_paths: List[str],
+    concurrency: int = 8,
 ) -> None:
     # For consistency when building page urls
-    if root_url.endswith("/"):
-        root_url.rstrip("/")
+    root_url = root_url.rstrip("/")
+    ignored_paths = frozenset(ignore_paths)
+    # All tutorials indexed in this run share the same timestamp
+    date_indexed = generate_date_indexed()
 
-    async with aiohttp.ClientSession() as http_client:
+    async with make_http_client() as http_client:
         async with AlgoliaIndex(
             key=algolia_key, app_id=algolia_id, name=index
         ) as algolia_index:
-            site_dir.resolve()
-            html_paths = site_dir.glob("**/*.html")
-            tasks: List[Awaitable] = []
-            for html_path in html_paths:
-                relative_path = str(PosixPath(html_path.relative_to(site_dir)))
-                if relative_path in ignore_paths:
-                    continue
-                page_url = f"{root_url}/{relative_path}"
-                tasks.append(
-                    index_tutorial_from_path(
+            html_paths = _iter_html_paths(site_dir)
+
+            async def worker() -> None:
+                # Workers share the html_paths generator, so at most
+                # ``concurrency`` tutorials are being indexed at once.
+                for html_path, relative_path in html_paths:
+                    if relative_path in ignored_paths:
+                        continue
+                    page_url = f"{root_url}/{relative_path}"
+                    await index_tutorial_from_path(
                         path=html_path,
                         url=page_url,
                         http_client=http_client,
                         algolia_index=algolia_index,
                         # hard-coded for now, will add a config system later
                         priority=0,
+                        date_indexed=date_indexed,
                     )
-                )
-            await asyncio.gather(*tasks)
+
+            await asyncio.gather(*[worker() for _ in range(concurrency)])
+
+
+def _iter_html_paths(site_dir: Path) -> Iterator[Tuple[Path, str]]:
+    """Iterate over the HTML files in a directory, recursively.
+
+    Yields
+    ------
+    path : `pathlib.Path`
+        Path of the HTML file.
+    relative_path : str
+        POSIX-style path of the HTML file, relative to ``site_dir``.
+    """
+    # os.walk lists each directory with a single scandir call, rather than
+    # building and matching a Path for every entry like Path.glob. Like
+    # Path.glob("**"), it doesn't descend into symlinked directories.
+    for dirpath, _, filenames in os.walk(site_dir):
+        relative_dir = PurePath(os.path.relpath(dirpath, site_dir)).as_posix()
+        for filename in filenames:
+            if not filename.endswith(".html"):
+                continue
+            if relative_dir == ".":
+                relative_path = filename
+            else:
+                relative_path = f"{relative_dir}/{filename}"
+            yield Path(dirpath, filename), relative_path
 
 
 async def run_index_tutorial(
@@ -155,7 +189,7 @@ async def run_index_tutorial(
     priority: int,
     path: Optional[Path] = None,
 ) -> None:
-    async with aiohttp.ClientSession() as http_client:
+    async with make_http_client() as http_client:
         async with AlgoliaIndex(
             key=algolia_key, app_id=algolia_id, name=index
         ) as algolia_index:
@@ -199,8 +233,7 @@ def guide(
     ),
 ) -> None:
     """Index a guide."""
-    event_loop = asyncio.get_event_loop()
-    event_loop.run_until_complete(
+    run_async(
         run_index_guide(
             url=url,
             algolia_id=algolia_id,
@@ -214,7 +247,7 @@ def guide(
 async def run_index_guide(
     *, url: str, algolia_id: str, algolia_key: str, index: str, priority: int
 ) -> None:
-    async with aiohttp.ClientSession() as http_client:
+    async with make_http_client() as http_client:
         async with AlgoliaIndex(
             key=algolia_key, app_id=algolia_id, name=index
         ) as algolia_index:
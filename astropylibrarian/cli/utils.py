@@ -0,0 +1,44 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Utilities for the command-line interface."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+try:
+    import uvloop
+
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
+__all__ = ["HAS_UVLOOP", "run_async"]
+
+T = TypeVar("T")
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion in a new event loop, like
+    `asyncio.run`.
+
+    The event loop is uvloop's faster implementation if uvloop is installed
+    (with the ``speedups`` extra). Only the loop used for this coroutine is
+    affected; the process-wide event loop policy isn't changed.
+    """
+    if not HAS_UVLOOP:
+        return asyncio.run(coro)
+
+    if hasattr(uvloop, "run"):  # uvloop >= 0.18
+        return uvloop.run(coro)
+
+    loop = uvloop.new_event_loop()
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(coro)
+    finally:
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
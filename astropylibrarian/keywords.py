@@ -1,11 +1,17 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 """Standardized Learn Astropy keywords."""
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, Union
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore
+
 KeywordTable = Dict[str, List[str]]
 """Keyword table data type.
 
@@ -31,6 +37,18 @@ class KeywordDb:
 
     def __init__(self, **kwargs: KeywordTable) -> None:
         self._keyword_groups = kwargs
+        self._keyword_lookups = {
+            group_name: self._make_keyword_lookup(table)
+            for group_name, table in kwargs.items()
+        }
+        # Index of every keyword form to the groups it belongs to, and the
+        # canonical keyword(s) it maps to in each group.
+        self._keyword_index: Dict[str, List[Tuple[str, List[str]]]] = {}
+        for group_name, lookup in self._keyword_lookups.items():
+            for keyword, canonical_keywords in lookup.items():
+                self._keyword_index.setdefault(keyword, []).append(
+                    (group_name, canonical_keywords)
+                )
 
     @classmethod
     def load(cls, path: Optional[Path] = None) -> "KeywordDb":
@@ -46,11 +64,23 @@ class KeywordDb:
         -------
         KeywordDb
             A keyword database instance.
+
+        Notes
+        -----
+        Keyword databases are cached by resolved path, so each YAML file is
+        only parsed once per process. Treat the returned instance as
+        read-only since it is shared with other callers.
         """
         if path is None:
             path = Path(__file__).parent / "data" / "keywords.yaml"
+        # Resolve the path so that different spellings of the same file
+        # share a cache entry.
+        return cls._load_path(Path(path).resolve())
 
-        db = yaml.safe_load(path.read_text())
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _load_path(cls, path: Path) -> "KeywordDb":
+        db = yaml.load(path.read_text(), Loader=SafeLoader)
 
         keyword_groups: Dict[str, KeywordTable] = {}
         for group_name in db:
@@ -75,6 +105,30 @@ class KeywordDb:
             keywords[keyword] = alternatives
         return keywords
 
+    @classmethod
+    def _make_keyword_lookup(cls, table: KeywordTable) -> Dict[str, List[str]]:
+        """Make a lookup table that maps every keyword form (canonical and
+        alternative) to the canonical keyword(s) for a keyword table.
+
+        Keys are normalized (see `_normalize_keyword`), like the input
+        keywords they are matched against.
+        """
+        lookup: Dict[str, List[str]] = {}
+        for keyword, alternates in table.items():
+            for alternate in alternates:
+                if alternate not in table:
+                    lookup.setdefault(
+                        cls._normalize_keyword(alternate), []
+                    ).append(keyword)
+        for keyword in table:
+            lookup[cls._normalize_keyword(keyword)] = [keyword]
+        return lookup
+
+    @staticmethod
+    def _normalize_keyword(keyword: str) -> str:
+        """Normalize a keyword for lookups."""
+        return keyword.lower().strip()
+
     def filter_keywords(
         self, input_keywords: List[str], keyword_group: str
     ) -> List[str]:
@@ -95,27 +149,66 @@ class KeywordDb:
             are normalized to match the vocabulary in ``keywords.yaml`` (some
             input keywords may be replaced with synonyms).
         """
-        try:
-            table = self._keyword_groups[keyword_group]
-        except KeyError:
-            raise ValueError(
-                f"Keyword group {keyword_group} is unknown. Available groups "
-                f"are: {self._keyword_groups.keys()}."
-            )
-
-        # Normalize the input keywords
-        input_keywords = [k.lower().strip() for k in input_keywords]
+        lookup = self._get_keyword_lookup(keyword_group)
 
         output_keywords: List[str] = []
 
+        # Local bindings avoid repeated attribute lookups in the loop
+        get = lookup.get
+        extend = output_keywords.extend
+        normalize = self._normalize_keyword
         for input_keyword in input_keywords:
-            if input_keyword in table.keys():
-                # Keyword is in group and already the canonical form
-                output_keywords.append(input_keyword)
-            else:
-                # See if the keyword is an alternative form
-                for keyword, alternates in table.items():
-                    if input_keyword in alternates:
-                        output_keywords.append(keyword)
+            # Normalize the input keyword and then look up its canonical
+            # form(s), if the keyword is in the group
+            canonical_keywords = get(normalize(input_keyword))
+            if canonical_keywords is not None:
+                extend(canonical_keywords)
 
         return output_keywords
+
+    def classify_keywords(
+        self, input_keywords: List[str], keyword_groups: Sequence[str]
+    ) -> Dict[str, List[str]]:
+        """Filter keywords for several groups at once.
+
+        This is equivalent to calling `filter_keywords` for each group, but
+        normalizes and looks up each input keyword only once, regardless of
+        the number of groups.
+
+        Parameters
+        ----------
+        input_keywords : list of str
+            Input keywords are keywords accessed from a source document.
+        keyword_groups : sequence of str
+            Names of the keyword groups. These are root-level keys in
+            astropylibrarian's ``keywords.yaml``
+
+        Returns
+        -------
+        dict
+            Normalized keywords (values) for each keyword group (keys).
+        """
+        output_keywords: Dict[str, List[str]] = {}
+        for group in keyword_groups:
+            # Ensure the group exists
+            self._get_keyword_lookup(group)
+            output_keywords[group] = []
+
+        for input_keyword in input_keywords:
+            normalized_keyword = self._normalize_keyword(input_keyword)
+            for group, canonical_keywords in self._keyword_index.get(
+                normalized_keyword, []
+            ):
+                if group in output_keywords:
+                    output_keywords[group].extend(canonical_keywords)
+
+        return output_keywords
+
+    def _get_keyword_lookup(self, keyword_group: str) -> Dict[str, List[str]]:
+        try:
+            return self._keyword_lookups[keyword_group]
+        except KeyError:
+            raise ValueError(
+                f"Keyword group {keyword_group} is unknown. Available groups "
+                f"are: {self._keyword_groups.keys()}."
+            )
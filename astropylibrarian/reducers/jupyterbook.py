@@ -3,13 +3,23 @@
 
 from __future__ import annotations
 
+import datetime
 from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
 from urllib.parse import urljoin, urlparse, urlunparse
 
+from lxml.cssselect import CSSSelector
 from pydantic import BaseModel, HttpUrl, validator
 
-from astropylibrarian.algolia.records import GuideRecord
-from astropylibrarian.reducers.utils import iter_sphinx_sections
+from astropylibrarian.algolia.records import (
+    GuideRecord,
+    generate_date_indexed,
+    validate_index_epoch,
+)
+from astropylibrarian.reducers.utils import (
+    compile_first_match_selector,
+    iter_sphinx_sections,
+    select_first,
+)
 
 if TYPE_CHECKING:
     import lxml.html
@@ -17,6 +27,29 @@ if TYPE_CHECKING:
     from astropylibrarian.reducers.utils import Section
     from astropylibrarian.resources import HtmlPage
 
+# CSS selectors are compiled to XPath once, rather than on every call to
+# an element's cssselect method. The "html" translator matches the
+# behavior of lxml.html's cssselect. Selectors where only the first match
+# is used are compiled to stop at that match.
+_SITE_TITLE_SELECTOR = compile_first_match_selector("#site-title")
+_LOGO_SELECTOR = compile_first_match_selector("img.logo")
+_MAIN_CONTENT_P_SELECTOR = compile_first_match_selector("#main-content p")
+_MAIN_CONTENT_IMG_SELECTOR = CSSSelector(
+    "#main-content img", translator="html"
+)
+_MAIN_CONTENT_SECTION_SELECTOR = compile_first_match_selector(
+    "#main-content .section"
+)
+_NAV_GITHUB_LINK_SELECTOR = compile_first_match_selector(
+    'nav a.external[href^="https://github.com"]'
+)
+_NAV_INTERNAL_LINK_SELECTOR = CSSSelector(
+    "nav#bd-docs-nav a.internal", translator="html"
+)
+
+_CLEAN_CONTENT_TABLE = str.maketrans({"\n": " ", "\\": " "})
+"""Translation table that replaces newlines and backslashes with spaces."""
+
 
 class JupyterBookPage:
     """A JupyterBook page, with accessors to key content."""
@@ -24,6 +57,7 @@ class JupyterBookPage:
     def __init__(self, html_page: HtmlPage):
         self.html_page = html_page
         self._doc = self.html_page.parse()
+        self._image_urls: Optional[List[str]] = None
 
     @property
     def doc(self) -> lxml.html.HtmlElement:
@@ -36,18 +70,16 @@ class JupyterBookPage:
     @property
     def title(self) -> Optional[str]:
         """The site's title (selector: ``#site-title``)."""
-        try:
-            element = self.doc.cssselect("#site-title")[0]
-        except IndexError:
+        element = select_first(_SITE_TITLE_SELECTOR, self.doc)
+        if element is None:
             return None
         return element.text_content()
 
     @property
     def logo_url(self) -> Optional[str]:
         """The URL of the site's logo (selector: ``img.logo``)."""
-        try:
-            element = self.doc.cssselect("img.logo")[0]
-        except IndexError:
+        element = select_first(_LOGO_SELECTOR, self.doc)
+        if element is None:
             return None
         return urljoin(self.html_page.url, element.attrib["src"])
 
@@ -56,9 +88,8 @@ class JupyterBookPage:
         """The content of the first paragraph within the main content
         (``#main-content``).
         """
-        try:
-            first_paragraph = self.doc.cssselect("#main-content p")[0]
-        except IndexError:
+        first_paragraph = select_first(_MAIN_CONTENT_P_SELECTOR, self.doc)
+        if first_paragraph is None:
             return None
         content = first_paragraph.text_content()
         return self._clean_content(content)
@@ -66,13 +97,10 @@ class JupyterBookPage:
     @property
     def github_repository(self) -> Optional[str]:
         """The GitHub repository URL, detected in the ``<nav>`` element."""
-        elements = self.doc.cssselect("nav a.external")
-        for element in elements:
-            href = element.attrib["href"]
-            if href.startswith("https://github.com"):
-                return href
-
-        return None
+        element = select_first(_NAV_GITHUB_LINK_SELECTOR, self.doc)
+        if element is None:
+            return None
+        return element.attrib["href"]
 
     @property
     def page_urls(self) -> List[str]:
@@ -81,15 +109,23 @@ class JupyterBookPage:
         """
         return [
             urljoin(self.html_page.url, link.attrib["href"])
-            for link in self.doc.cssselect("nav#bd-docs-nav a.internal")
+            for link in _NAV_INTERNAL_LINK_SELECTOR(self.doc)
             if link.attrib["href"] != "#"  # skip homepage
         ]
 
     @property
     def image_urls(self) -> List[str]:
-        """URLs to images in the main content area."""
-        images = self.doc.cssselect("#main-content img")
-        return [urljoin(self.url, img.attrib["src"]) for img in images]
+        """URLs to images in the main content area.
+
+        The URLs are computed once and cached since this property is accessed
+        for every section's record.
+        """
+        if self._image_urls is None:
+            images = _MAIN_CONTENT_IMG_SELECTOR(self.doc)
+            self._image_urls = [
+                urljoin(self.url, img.attrib["src"]) for img in images
+            ]
+        return self._image_urls
 
     def iter_sections(self) -> Iterator[Section]:
         """Iterate through sections in the page.
@@ -100,7 +136,7 @@ class JupyterBookPage:
             A section of the document, which includes its content, heading
             hierarchy and anchor link.
         """
-        root = self.doc.cssselect("#main-content .section")[0]
+        root = _MAIN_CONTENT_SECTION_SELECTOR(self.doc)[0]
         for section in iter_sphinx_sections(
             root_section=root,
             base_url=self.html_page.url,
@@ -111,7 +147,11 @@ class JupyterBookPage:
             yield section
 
     def iter_records(
-        self, *, site_metadata: JupyterBookMetadata, index_epoch: str
+        self,
+        *,
+        site_metadata: JupyterBookMetadata,
+        index_epoch: str,
+        date_indexed: Optional[datetime.datetime] = None,
     ) -> Iterator[GuideRecord]:
         """Iterate over all Algolia search database records that are
         extractable from the page.
@@ -126,22 +166,38 @@ class JupyterBookPage:
         index_epoch : str
             A unique identifier for the indexing job. This is used to delete
             old records from previous indexings.
+        date_indexed : datetime.datetime, optional
+            Timestamp of the indexing job, shared by all records. If `None`,
+            the current time is used.
 
         Yields
         ------
         `astropylibrarian.algolia.records.GuideRecord`
             A record that is exportable to Algolia.
+
+        Raises
+        ------
+        ValueError
+            Raised if ``index_epoch`` is not a UUID4 string.
         """
+        index_epoch = validate_index_epoch(index_epoch)
+        if date_indexed is None:
+            date_indexed = generate_date_indexed()
         for section in self.iter_sections():
             yield GuideRecord.from_section(
                 site_metadata=site_metadata,
                 page=self,
                 section=section,
                 index_epoch=index_epoch,
+                date_indexed=date_indexed,
             )
 
     def iter_algolia_objects(
-        self, *, site_metadata: JupyterBookMetadata, index_epoch: str
+        self,
+        *,
+        site_metadata: JupyterBookMetadata,
+        index_epoch: str,
+        date_indexed: Optional[datetime.datetime] = None,
     ) -> Iterator[Dict[str, Any]]:
         """Iterate over all objects that are extractable from the page in
         a format ready to use with the algoliasearch client.
@@ -156,6 +212,9 @@ class JupyterBookPage:
         index_epoch : str
             A unique identifier for the indexing job. This is used to delete
             old records from previous indexings.
+        date_indexed : datetime.datetime, optional
+            Timestamp of the indexing job, shared by all records. If `None`,
+            the current time is used.
 
         Yields
         ------
@@ -164,18 +223,19 @@ class JupyterBookPage:
             methods.
         """
         for record in self.iter_records(
-            site_metadata=site_metadata, index_epoch=index_epoch
+            site_metadata=site_metadata,
+            index_epoch=index_epoch,
+            date_indexed=date_indexed,
         ):
             yield record.export_to_algolia()
 
     @staticmethod
     def _clean_content(x: str) -> str:
         """Clean HTML content by removing extra newlines."""
+        # Escaped newlines are replaced first; translating the backslash
+        # alone would leave a stray "n" behind.
         x = x.replace(r"\n", " ")
-        x = x.replace("\n", " ")
-        x = x.replace("\\", " ")
-        x = x.strip()
-        return x
+        return x.translate(_CLEAN_CONTENT_TABLE).strip()
 
 
 class JupyterBookMetadata(BaseModel):
@@ -5,15 +5,38 @@ into search records.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Type
+import datetime
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Type,
+)
 from urllib.parse import urljoin
 
-from astropylibrarian.algolia.records import TutorialRecord
+import lxml.etree
+from lxml.cssselect import CSSSelector
+
+from astropylibrarian.algolia.records import (
+    TUTORIAL_KEYWORD_GROUPS,
+    TutorialRecord,
+    generate_date_indexed,
+    validate_index_epoch,
+)
 from astropylibrarian.keywords import KeywordDb
 from astropylibrarian.reducers.utils import (
     Section,
+    compile_first_match_selector,
     iter_nbcollection_sections,
     iter_sphinx_sections,
+    select_first,
 )
 
 if TYPE_CHECKING:
@@ -25,18 +48,94 @@ __all__ = [
     "ReducedTutorial",
     "ReducedSphinxTutorial",
     "ReducedNbcollectionTutorial",
+    "get_tutorial_reducer",
+    "reduce_pages",
 ]
 
+# CSS selectors are compiled to XPath once, rather than on every call to
+# an element's cssselect method. The "html" translator matches the
+# behavior of lxml.html's cssselect. Selectors where only the first match
+# is used are compiled to stop at that match.
+_NOTEBOOK_SELECTOR = compile_first_match_selector(".jp-Notebook")
+_H1_SELECTOR = compile_first_match_selector("h1")
+_IMG_SELECTOR = CSSSelector("img", translator="html")
+_SPHINX_AUTHORS_SELECTOR = compile_first_match_selector(
+    ".card section p, .card .section p"
+)
+_SPHINX_KEYWORDS_SELECTOR = compile_first_match_selector("#keywords p")
+_SPHINX_SUMMARY_SELECTOR = compile_first_match_selector("#summary p")
+_SPHINX_IMG_SELECTOR = CSSSelector(
+    ".card section img, .card .section img", translator="html"
+)
+_SPHINX_ROOT_SELECTOR = compile_first_match_selector(
+    ".card .section, .card section"
+)
+_SPHINX_SIBLING_SECTIONS_XPATH = lxml.etree.XPath(
+    "following-sibling::*[self::section or (self::div and "
+    "contains(concat(' ', normalize-space(@class), ' '), ' section '))]"
+)
+"""Select the ``section`` elements and ``div.section`` elements that follow
+an element.
+"""
+_NBCOLLECTION_AUTHORS_SELECTOR = compile_first_match_selector("#Authors + p")
+_NBCOLLECTION_KEYWORDS_SELECTOR = compile_first_match_selector("#Keywords + p")
+_NBCOLLECTION_SUMMARY_SELECTOR = compile_first_match_selector("#Summary + p")
+
+IGNORED_HEADINGS = frozenset(["authors", "keywords", "summary"])
+"""Headings (lowercase) of tutorial sections that are ignored because they
+are part of the tutorial's metadata.
+"""
+
+_ABSOLUTE_URL_PREFIXES = ("http://", "https://", "data:")
+"""Prefixes of image ``src`` values that don't need to be joined to the page
+URL.
+"""
+
+_COMMA_SEPARATOR_PATTERN = re.compile(r"\s*,\s*")
+"""Pattern for a comma separator, including surrounding whitespace."""
+
+_CONTENT_NEWLINE_PATTERN = re.compile(r"\\n|\n|\\")
+"""Pattern for newlines (including escaped newline sequences) and
+backslashes in content.
+"""
+
 
 def get_tutorial_reducer(html_page: HtmlPage) -> Type[ReducedTutorial]:
     """Get the reducer appropriate for the tutorial's structure."""
     doc = html_page.parse()
-    if len(doc.cssselect(".jp-Notebook")) > 0:
+    if _NOTEBOOK_SELECTOR(doc):
         return ReducedNbcollectionTutorial
     else:
         return ReducedSphinxTutorial
 
 
+def reduce_pages(
+    pages: Iterable[HtmlPage], *, workers: Optional[int] = None
+) -> Iterator[ReducedTutorial]:
+    """Reduce many tutorial pages in parallel worker processes.
+
+    Parameters
+    ----------
+    pages : iterable of `astropylibrarian.resources.HtmlPage`
+        The downloaded HTML pages.
+    workers : int, optional
+        The number of worker processes. Defaults to the number of CPUs.
+
+    Yields
+    ------
+    ReducedTutorial
+        The reduced tutorial for each page, in the same order as ``pages``.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(_reduce_page, pages, chunksize=8)
+
+
+def _reduce_page(html_page: HtmlPage) -> ReducedTutorial:
+    """Reduce a single tutorial page (run in a worker process)."""
+    reducer = get_tutorial_reducer(html_page)
+    return reducer(html_page=html_page)
+
+
 class ReducedTutorial:
     """A reduction of a notebook-based learn.astropy tutorial page into search
     records.
@@ -95,7 +194,7 @@ class ReducedTutorial:
 
         # These are headings for sections that should be ignored because
         # they're part of the metadata.
-        self.ignored_headings = set(["authors", "keywords", "summary"])
+        self.ignored_headings: FrozenSet[str] = IGNORED_HEADINGS
 
         self.process_html(html_page)
 
@@ -117,17 +216,33 @@ class ReducedTutorial:
             `True` if the section should be ignored; `False` if it should be
             accepted.
         """
-        section_headings = set([h.lower() for h in section.headings])
-        if section_headings.intersection(self.ignored_headings):
-            return True
-        else:
-            return False
+        return any(
+            h.lower() in self.ignored_headings for h in section.headings
+        )
 
     def iter_records(
-        self, *, index_epoch: str, priority: int
+        self,
+        *,
+        index_epoch: str,
+        priority: int,
+        date_indexed: Optional[datetime.datetime] = None,
     ) -> Iterator[TutorialRecord]:
-        """Iterate over Algolia records in the tutorial."""
+        """Iterate over Algolia records in the tutorial.
+
+        All records share the same ``date_indexed`` timestamp, which is the
+        current time if not set.
+
+        Raises
+        ------
+        ValueError
+            Raised if ``index_epoch`` is not a UUID4 string.
+        """
+        index_epoch = validate_index_epoch(index_epoch)
+        if date_indexed is None:
+            date_indexed = generate_date_indexed()
         keyworddb = KeywordDb.load()
+        keyword_groups = self.classify_keywords(keyworddb)
+        base_url = TutorialRecord.compute_base_url(tutorial=self)
         for section in self.sections:
             yield TutorialRecord.from_section(
                 tutorial=self,
@@ -135,10 +250,35 @@ class ReducedTutorial:
                 keyworddb=keyworddb,
                 index_epoch=index_epoch,
                 priority=priority,
+                keyword_groups=keyword_groups,
+                base_url=base_url,
+                date_indexed=date_indexed,
             )
 
+    def classify_keywords(self, keyworddb: KeywordDb) -> Dict[str, List[str]]:
+        """Sort the tutorial's keywords into the keyword groups used by
+        tutorial records.
+
+        Parameters
+        ----------
+        keyworddb : `astropylibrarian.keywords.KeywordDb`
+            The keyword database.
+
+        Returns
+        -------
+        dict
+            Normalized keywords (values) for each keyword group (keys).
+        """
+        return keyworddb.classify_keywords(
+            self.keywords, TUTORIAL_KEYWORD_GROUPS
+        )
+
     def iter_algolia_objects(
-        self, *, index_epoch: str, priority: int
+        self,
+        *,
+        index_epoch: str,
+        priority: int,
+        date_indexed: Optional[datetime.datetime] = None,
     ) -> Iterator[Dict[str, Any]]:
         """Iterate over all objects that are extractable from the tutorial in
         a format ready to use with the algoliasearch client.
@@ -150,7 +290,9 @@ class ReducedTutorial:
             methods.
         """
         for record in self.iter_records(
-            index_epoch=index_epoch, priority=priority
+            index_epoch=index_epoch,
+            priority=priority,
+            date_indexed=date_indexed,
         ):
             yield from record.export_capped_records_to_algolia()
 
@@ -165,7 +307,7 @@ class ReducedTutorial:
     @staticmethod
     def _parse_comma_list(element: lxml.html.HtmlElement) -> List[str]:
         content = element.text_content()
-        return [s.strip() for s in content.split(",")]
+        return _COMMA_SEPARATOR_PATTERN.split(content.strip())
 
 
 class ReducedSphinxTutorial(ReducedTutorial):
@@ -175,37 +317,31 @@ class ReducedSphinxTutorial(ReducedTutorial):
         """Process the HTML page."""
         doc = html_page.parse()
 
-        try:
-            self._h1 = self._get_section_title(doc.cssselect("h1")[0])
-        except IndexError:
-            pass
+        h1_element = select_first(_H1_SELECTOR, doc)
+        if h1_element is not None:
+            self._h1 = self._get_section_title(h1_element)
 
-        try:
-            authors_paragraph = doc.cssselect(
-                ".card section p, .card .section p"
-            )[0]
+        authors_paragraph = select_first(_SPHINX_AUTHORS_SELECTOR, doc)
+        if authors_paragraph is not None:
             self._authors = self._parse_comma_list(authors_paragraph)
-        except IndexError:
-            pass
 
-        try:
-            keywords_paragraph = doc.cssselect("#keywords p")[0]
+        keywords_paragraph = select_first(_SPHINX_KEYWORDS_SELECTOR, doc)
+        if keywords_paragraph is not None:
             self._keywords = self._parse_comma_list(keywords_paragraph)
-        except IndexError:
-            pass
 
-        try:
-            summary_paragraph = doc.cssselect("#summary p")[0]
+        summary_paragraph = select_first(_SPHINX_SUMMARY_SELECTOR, doc)
+        if summary_paragraph is not None:
             self._summary = summary_paragraph.text_content().replace("\n", " ")
-        except IndexError:
-            pass
 
-        image_elements = doc.cssselect(".card section img, .card .section img")
+        # Dictionary keys de-duplicate repeated figures, preserving order
+        images: Dict[str, None] = {}
+        image_elements = _SPHINX_IMG_SELECTOR(doc)
         for image_element in image_elements:
             img_src = image_element.attrib["src"]
-            self._images.append(urljoin(self.url, img_src))
+            images[_resolve_image_url(self.url, img_src)] = None
+        self._images = list(images)
 
-        root_section = doc.cssselect(".card .section, .card section")[0]
+        root_section = _SPHINX_ROOT_SELECTOR(doc)[0]
         for s in iter_sphinx_sections(
             base_url=self._url,
             root_section=root_section,
@@ -221,9 +357,7 @@ class ReducedSphinxTutorial(ReducedTutorial):
         # should be subsections of that. In real life, though, it's easy
         # to accidentally use additional h1 eleemnts for subsections.
         h1_heading = self._sections[-1].headings[-1]
-        for sibling in root_section.itersiblings(tag=("div", "section")):
-            if sibling.tag == "div" and "section" not in sibling.classes:
-                continue
+        for sibling in _SPHINX_SIBLING_SECTIONS_XPATH(root_section):
             for s in iter_sphinx_sections(
                 root_section=sibling,
                 base_url=self._url,
@@ -248,41 +382,35 @@ class ReducedNbcollectionTutorial(ReducedTutorial):
         """Process the HTML page."""
         doc = html_page.parse()
 
-        try:
-            self._h1 = (
-                doc.cssselect("h1")[0].text_content().rstrip("¶").strip()
-            )
-        except IndexError:
-            pass
+        h1_element = select_first(_H1_SELECTOR, doc)
+        if h1_element is not None:
+            self._h1 = h1_element.text_content().rstrip("¶").strip()
 
-        try:
-            authors_paragraph = doc.cssselect("#Authors + p")[0]
+        authors_paragraph = select_first(_NBCOLLECTION_AUTHORS_SELECTOR, doc)
+        if authors_paragraph is not None:
             self._authors = self._parse_comma_list(authors_paragraph)
-        except IndexError:
-            pass
 
-        try:
-            keywords_paragraph = doc.cssselect("#Keywords + p")[0]
+        keywords_paragraph = select_first(_NBCOLLECTION_KEYWORDS_SELECTOR, doc)
+        if keywords_paragraph is not None:
             self._keywords = self._parse_comma_list(keywords_paragraph)
-        except IndexError:
-            pass
 
-        try:
-            summary_paragraph = doc.cssselect("#Summary + p")[0]
+        summary_paragraph = select_first(_NBCOLLECTION_SUMMARY_SELECTOR, doc)
+        if summary_paragraph is not None:
             self._summary = summary_paragraph.text_content().replace("\n", " ")
-        except IndexError:
-            pass
 
-        image_elements = doc.cssselect("img")
+        # Dictionary keys de-duplicate repeated figures, preserving order
+        images: Dict[str, None] = {}
+        image_elements = _IMG_SELECTOR(doc)
         for image_element in image_elements:
             img_src = image_element.attrib["src"]
             if img_src.startswith("data:"):
                 # skip embedded images
                 continue
-            self._images.append(urljoin(self.url, img_src))
+            images[_resolve_image_url(self.url, img_src)] = None
+        self._images = list(images)
 
         self._sections = []
-        root_element = doc.cssselect(".jp-Notebook")[0]
+        root_element = _NOTEBOOK_SELECTOR(doc)[0]
         for s in iter_nbcollection_sections(
             root_element=root_element,
             base_url=html_page.url,
@@ -293,9 +421,16 @@ class ReducedNbcollectionTutorial(ReducedTutorial):
                 self._sections.append(s)
 
 
+def _resolve_image_url(base_url: str, img_src: str) -> str:
+    """Resolve an image's ``src`` relative to the page URL, passing through
+    URLs that are already absolute.
+    """
+    if img_src.startswith(_ABSOLUTE_URL_PREFIXES):
+        return img_src
+    return urljoin(base_url, img_src)
+
+
 def clean_content(x: str) -> str:
-    x = x.strip()
-    x = x.replace(r"\n", " ")
-    x = x.replace("\n", " ")
-    x = x.replace("\\", " ")
-    return x
+    # Replace escaped newline sequences, newlines, and backslashes with
+    # spaces in a single pass
+    return _CONTENT_NEWLINE_PATTERN.sub(" ", x.strip())
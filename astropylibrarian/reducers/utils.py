@@ -5,25 +5,58 @@
 from __future__ import annotations
 
 import logging
-from copy import deepcopy
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Callable, Generator, List, Optional
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Generator, Iterator, List, Optional
+
+import lxml.etree
+from lxml.cssselect import CSSSelector
 
 if TYPE_CHECKING:
     import lxml.html
 
-__all__ = ["Section", "iter_sphinx_sections", "iter_nbcollection_sections"]
+__all__ = [
+    "Section",
+    "iter_sphinx_sections",
+    "iter_nbcollection_sections",
+    "compile_first_match_selector",
+    "select_first",
+]
 
 logger = logging.getLogger(__name__)
 
 
-_HEADING_TAGS = ("h1", "h2", "h3", "h4", "h5", "h6")
+_HEADING_TAGS = frozenset(("h1", "h2", "h3", "h4", "h5", "h6"))
+
+# CSS selectors for nbcollection cell wrappers, compiled once
+_RENDERED_HTML_SELECTOR = CSSSelector(
+    ".jp-RenderedHTMLCommon", translator="html"
+)
+_CODEMIRROR_SELECTOR = CSSSelector(".jp-CodeMirrorEditor", translator="html")
+
+# XPath predicate for elements with the "cell_output" class (Jupyter outputs)
+_CELL_OUTPUT_PREDICATE = (
+    "[contains(concat(' ', normalize-space(@class), ' '), ' cell_output ')]"
+)
+_HAS_CELL_OUTPUT_XPATH = lxml.etree.XPath(
+    f"boolean(descendant::*{_CELL_OUTPUT_PREDICATE})"
+)
+_CELL_OUTPUT_DEPTH_XPATH = lxml.etree.XPath(
+    f"count(ancestor-or-self::*{_CELL_OUTPUT_PREDICATE})"
+)
+# Text nodes that are not inside a cell_output element below the context
+# element (they have no more cell_output ancestors than the context element)
+_TEXT_OUTSIDE_CELL_OUTPUT_XPATH = lxml.etree.XPath(
+    f"descendant::text()[count(ancestor::*{_CELL_OUTPUT_PREDICATE}) = $depth]"
+)
 
 
 @dataclass
 class Section:
     """A section of content."""
 
+    # Declared by hand since dataclass(slots=True) requires Python 3.10
+    __slots__ = ("content", "headings", "url")
+
     content: str
     """The plain-text content of the section.
     """
@@ -95,59 +128,101 @@ def iter_sphinx_sections(
         Yields `Section` objects for each section segment. Sections are yielded
         depth-first. The top-level section is yielded last.
     """
-    id_ = root_section.attrib["id"]
-    url = f"{base_url}#{id_}"
-    text_elements: List[str] = []
-    for element in root_section:
-        if element.tag in _HEADING_TAGS:
-            current_header = element.text_content()
-            if header_callback:
-                current_header = header_callback(current_header)
-            current_headers = headers + [current_header]
-        elif (element.tag == "section") or (
-            element.tag == "div" and "section" in element.classes
-        ):
-            yield from iter_sphinx_sections(
-                root_section=element,
-                base_url=base_url,
-                headers=current_headers,
-                header_callback=header_callback,
-                content_callback=content_callback,
-            )
-        else:
-            # To modify this element to extract content from it
-            # To extract content from this element we may need to modify it
-            # We don't want to affect the whole document tree though, so
-            # we make this temporary copy.
-            content_element = deepcopy(element)
-
-            # Delete "cell_output" divs, which are the code outputs from
-            # Jupyter-based pages (Jupyter Notebook). The outputs can be large
-            # and are often less relevant.
-            try:
-                output_divs = content_element.find_class("cell_output")
-                for output_div in output_divs:
-                    output_div.drop_tree()
-            except ValueError:
-                # Raised because "HtmlComment" element does not support
-                # find_class().
-                pass
-
-            # Get plain-text content of the section
-            try:
-                if content_callback:
-                    text_elements.append(
-                        content_callback(content_element.text_content())
+    stack = [_SphinxSectionFrame.from_element(root_section, base_url, headers)]
+    while stack:
+        # Resume iterating over the children of the innermost open section
+        frame = stack[-1]
+        for element in frame.children:
+            tag = element.tag
+            if tag in _HEADING_TAGS:
+                current_header = element.text_content()
+                if header_callback:
+                    current_header = header_callback(current_header)
+                frame.current_headers = frame.headers + [current_header]
+            elif (tag == "section") or (
+                tag == "div" and "section" in _get_class_names(element)
+            ):
+                # Descend into the subsection; this section's iteration
+                # resumes once the subsection is finished.
+                stack.append(
+                    _SphinxSectionFrame.from_element(
+                        element, base_url, frame.get_current_headers()
                     )
-                else:
-                    text_elements.append(content_element.text_content())
-            except ValueError:
-                logger.debug("Could not get content from %s", content_element)
-                continue
+                )
+                break
+            else:
+                # Get plain-text content of the section
+                try:
+                    text_content = _get_text_content_without_outputs(element)
+                except ValueError:
+                    logger.debug("Could not get content from %s", element)
+                    continue
+                if content_callback:
+                    text_content = content_callback(text_content)
+                frame.text_elements.append(text_content)
+        else:
+            stack.pop()
+            yield Section(
+                content="\n\n".join(frame.text_elements),
+                headings=frame.get_current_headers(),
+                url=frame.url,
+            )
+
+
+@dataclass
+class _SphinxSectionFrame:
+    """The traversal state of a section that `iter_sphinx_sections` has
+    entered, but not yet finished.
+    """
 
-    yield Section(
-        content="\n\n".join(text_elements), headings=current_headers, url=url
-    )
+    children: Iterator[lxml.html.HtmlElement]
+    """Iterator over the section's child elements (excluding comments and
+    processing instructions).
+    """
+
+    headers: List[str]
+    """Heading titles at the hierarchical levels above the section."""
+
+    url: str
+    """The URL of the section."""
+
+    text_elements: List[str] = field(default_factory=list)
+    """The section's plain-text content, collected so far."""
+
+    current_headers: Optional[List[str]] = None
+    """The headers, including the section's own heading once it's found."""
+
+    @classmethod
+    def from_element(
+        cls, element: lxml.html.HtmlElement, base_url: str, headers: List[str]
+    ) -> _SphinxSectionFrame:
+        id_ = element.attrib["id"]
+        # Only elements are visited; libxml2 skips comments and processing
+        # instructions, whose text isn't content.
+        children = element.iterchildren(lxml.etree.Element)
+        return cls(children=children, headers=headers, url=f"{base_url}#{id_}")
+
+    def get_current_headers(self) -> List[str]:
+        if self.current_headers is None:
+            raise ValueError(f"Section {self.url} does not have a heading")
+        return self.current_headers
+
+
+def _get_text_content_without_outputs(
+    element: "lxml.html.HtmlElement",
+) -> str:
+    """Get the plain-text content of an element, excluding the content of
+    any "cell_output" elements inside it.
+
+    The "cell_output" divs are the code outputs from Jupyter-based pages
+    (Jupyter Notebook). The outputs can be large and are often less relevant.
+    The text is collected without modifying (or copying) the element, whose
+    document may be shared with other readers.
+    """
+    if not _HAS_CELL_OUTPUT_XPATH(element):
+        return element.text_content()
+    depth = _CELL_OUTPUT_DEPTH_XPATH(element)
+    return "".join(_TEXT_OUTSIDE_CELL_OUTPUT_XPATH(element, depth=depth))
 
 
 def iter_nbcollection_sections(
@@ -181,6 +256,8 @@ def iter_nbcollection_sections(
         depth-first. The top-level section is yielded last.
     """
     current_section = Section(content="", headings=[], url="")
+    # Content strings of the current section, joined when it's yielded
+    content_parts: List[str] = []
 
     for content_element in iter_nbcollection_content_elements(
         root_element=root_element,
@@ -188,18 +265,23 @@ def iter_nbcollection_sections(
         header_callback=header_callback,
         content_callback=content_callback,
     ):
-        logger.debug(
-            "Processing %s %s ",
-            content_element.tag,
-            content_element.attrib.get("class"),
-        )
-        if content_element.tag in _HEADING_TAGS:
+        if logger.isEnabledFor(logging.DEBUG):
+            # Skip the attribute lookup for every element unless debugging
+            logger.debug(
+                "Processing %s %s ",
+                content_element.tag,
+                content_element.attrib.get("class"),
+            )
+        tag = content_element.tag
+        if tag in _HEADING_TAGS:
             # A new heading can trigger a new section.
             # First yield the current content if it already has content
-            if current_section.headings and current_section.content:
+            if current_section.headings and content_parts:
+                current_section.content = " ".join(content_parts)
                 yield current_section
 
             # Now reset the content stack
+            content_parts = []
             header_id = ""
             if "id" in content_element.attrib.keys():
                 header_id = content_element.attrib["id"]
@@ -212,22 +294,19 @@ def iter_nbcollection_sections(
             logger.debug("Got header %s\n", header_content)
 
             current_section = current_section.new_section(
-                tag=content_element.tag,
+                tag=tag,
                 header=header_content,
                 url=f"{base_url}#{header_id}",
             )
         else:
+            new_content = content_element.text_content()
             if content_callback:
-                new_content = content_callback(content_element.text_content())
-                current_section.content += (
-                    f" {content_callback(content_element.text_content())}"
-                )
-            else:
-                new_content = content_element.get_content()
-            current_section.content += f" {new_content}"
+                new_content = content_callback(new_content)
+            content_parts.append(new_content)
             logger.debug("Got content\n%s\n", new_content)
 
     if current_section.headings:
+        current_section.content = " ".join(content_parts)
         yield current_section
 
 
@@ -261,15 +340,61 @@ def iter_nbcollection_content_elements(
       index.
     """
     for element in root_element:
-        if "jp-Cell-inputWrapper" in element.classes:
-            parents = element.cssselect(".jp-RenderedHTMLCommon")
+        class_names = _get_class_names(element)
+        if "jp-Cell-inputWrapper" in class_names:
+            parents = _RENDERED_HTML_SELECTOR(element)
             for parent in parents:
                 for content_element in parent:
                     yield content_element
-        elif "jp-CodeCell" in element.classes:
-            parents = element.cssselect(".jp-CodeMirrorEditor")
+        elif "jp-CodeCell" in class_names:
+            parents = _CODEMIRROR_SELECTOR(element)
             for parent in parents:
                 for content_element in parent:
                     yield content_element
         else:
             continue
+
+
+def _get_class_names(element: lxml.html.HtmlElement) -> List[str]:
+    """Get the names in an element's ``class`` attribute.
+
+    This is a lightweight alternative to ``HtmlElement.classes``, which
+    builds a `lxml.html.Classes` set wrapper for every call.
+    """
+    return (element.get("class") or "").split()
+
+
+def compile_first_match_selector(css: str) -> lxml.etree.XPath:
+    """Compile a CSS selector into an XPath expression that selects only the
+    first matching element, in document order.
+
+    Use this for selectors where only the first match is used, with
+    `select_first`. The ``[1]`` predicate lets libxml2 stop at the first
+    match rather than collecting every match.
+
+    Parameters
+    ----------
+    css : str
+        A CSS selector. It is translated with the same HTML rules as
+        ``lxml.html.HtmlElement.cssselect``.
+
+    Returns
+    -------
+    lxml.etree.XPath
+        The compiled XPath expression. Calling it with an element returns a
+        list with at most one element.
+    """
+    css_path = CSSSelector(css, translator="html").path
+    return lxml.etree.XPath(f"({css_path})[1]")
+
+
+def select_first(
+    selector: lxml.etree.XPath, element: lxml.html.HtmlElement
+) -> Optional[lxml.html.HtmlElement]:
+    """Get the first element selected by a compiled selector, or `None` if
+    nothing matches.
+    """
+    matches = selector(element)
+    if matches:
+        return matches[0]
+    return None
@@ -3,14 +3,35 @@
 
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Mapping, Optional, Type, TypeVar
+from typing import Any, Dict, Mapping, Optional, Type, TypeVar
 
 import lxml.html
 
 HtmlPageType = TypeVar("HtmlPageType", bound="HtmlPage")
 
+_parsers = threading.local()
+"""Thread-local storage for HTML parsers (lxml parsers must not be shared
+between threads).
+"""
+
+
+def _get_html_parser() -> lxml.html.HTMLParser:
+    """Get the HTML parser for the current thread.
+
+    Comments are dropped at parse time since no reducer uses them, and the
+    parser does not build an index of element IDs (ID lookups are done with
+    XPath attribute tests).
+    """
+    try:
+        return _parsers.html_parser
+    except AttributeError:
+        parser = lxml.html.HTMLParser(remove_comments=True, collect_ids=False)
+        _parsers.html_parser = parser
+        return parser
+
 
 @dataclass
 class HtmlPage:
@@ -34,9 +55,35 @@ class HtmlPage:
     headers: Mapping[str, Any] = field(default_factory=dict)
     """The HTTP response headers."""
 
+    _doc: Optional[lxml.html.HtmlElement] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """The parsed document, cached by `parse`."""
+
+    _doc_html: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """The ``html`` that ``_doc`` was parsed from."""
+
     def parse(self) -> lxml.html.HtmlElement:
-        """Parse the HTML content with ``lxml.html``."""
-        return lxml.html.document_fromstring(self.html)
+        """Parse the HTML content with ``lxml.html``.
+
+        The parsed document is cached and shared by all callers, so treat it
+        as read-only. The cache is invalidated if ``html`` is replaced.
+        """
+        if self._doc is None or self._doc_html is not self.html:
+            self._doc = lxml.html.document_fromstring(
+                self.html, parser=_get_html_parser()
+            )
+            self._doc_html = self.html
+        return self._doc
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # lxml trees can't be pickled; a copy re-parses on demand.
+        state = self.__dict__.copy()
+        state["_doc"] = None
+        state["_doc_html"] = None
+        return state
 
     @classmethod
     def from_path(
@@ -3,10 +3,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING
 
-from astropylibrarian.algolia.client import escape_facet_value
+from astropylibrarian.algolia.client import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_MAX_IN_FLIGHT,
+    escape_facet_value,
+)
 
 if TYPE_CHECKING:
     from typing import Any, AsyncIterator, Dict, List
@@ -17,26 +22,61 @@ logger = logging.getLogger(__name__)
 
 
 async def delete_root_url(
-    *, root_url: str, algolia_index: AlgoliaIndexType
+    *,
+    root_url: str,
+    algolia_index: AlgoliaIndexType,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
 ) -> List[str]:
-    """Delete all Algolia records associated with a ``root_url``."""
+    """Delete all Algolia records associated with a ``root_url``.
+
+    Records are deleted in batches of ``batch_size`` objectIDs while the
+    search for records continues, with up to ``max_in_flight`` batch requests
+    in flight at once.
+    """
     object_ids: List[str] = []
-    async for record in search_for_records(
-        index=algolia_index, root_url=root_url
-    ):
-        if record["root_url"] != root_url:
-            logger.warning(
-                "Search failure, root url of %s is %s",
-                record["objectID"],
-                record["root_url"],
-            )
-            continue
-        object_ids.append(record["objectID"])
-
-    logger.debug("Found %d objects for deletion", len(object_ids))
-
-    response = await algolia_index.delete_objects_async(object_ids)
-    logger.debug("Algolia response:\n%s", response.raw_responses)
+    batch: List[str] = []
+    semaphore = asyncio.Semaphore(max_in_flight)
+    tasks: List[asyncio.Future] = []
+
+    async def delete_batch(batch: List[str]) -> None:
+        try:
+            response = await algolia_index.delete_objects_async(batch)
+            logger.debug("Algolia response:\n%s", response.raw_responses)
+        finally:
+            semaphore.release()
+
+    async def schedule_batch(batch: List[str]) -> None:
+        # Waiting for a free slot pauses the search, bounding the number of
+        # objectIDs that are waiting for deletion.
+        await semaphore.acquire()
+        tasks.append(asyncio.ensure_future(delete_batch(batch)))
+
+    try:
+        async for record in search_for_records(
+            index=algolia_index, root_url=root_url
+        ):
+            if record["root_url"] != root_url:
+                logger.warning(
+                    "Search failure, root url of %s is %s",
+                    record["objectID"],
+                    record["root_url"],
+                )
+                continue
+            object_ids.append(record["objectID"])
+            batch.append(record["objectID"])
+            if len(batch) >= batch_size:
+                await schedule_batch(batch)
+                batch = []
+
+        if batch:
+            await schedule_batch(batch)
+    finally:
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
 
     logger.info("Deleted %d objects", len(object_ids))
 
@@ -2,18 +2,46 @@
 """Workflow for downloading an HTML page.
 """
 
-__all__ = ["download_html"]
+__all__ = ["download_html", "make_http_client"]
 
-from typing import TYPE_CHECKING
+import aiohttp
 
 from astropylibrarian.resources import HtmlPage
 
-if TYPE_CHECKING:
-    import aiohttp
+MAX_CONNECTIONS_PER_HOST = 8
+"""Default maximum number of simultaneous connections to a single host."""
+
+
+def make_http_client(
+    *, limit_per_host: int = MAX_CONNECTIONS_PER_HOST
+) -> aiohttp.ClientSession:
+    """Create an aiohttp client session with a connection pool that is tuned
+    for downloading many pages from the same site.
+
+    Create a single session and share it across downloads so that
+    connections are reused (the session is an async context manager).
+
+    Parameters
+    ----------
+    limit_per_host : `int`, optional
+        Maximum number of simultaneous connections to a single host. Excess
+        requests wait for a free connection.
+
+    Returns
+    -------
+    http_client : `aiohttp.ClientSession`
+        The client session.
+    """
+    connector = aiohttp.TCPConnector(
+        limit_per_host=limit_per_host,
+        ttl_dns_cache=600,
+        keepalive_timeout=60,
+    )
+    return aiohttp.ClientSession(connector=connector)
 
 
 async def download_html(
-    *, url: str, http_client: "aiohttp.ClientSession"
+    *, url: str, http_client: aiohttp.ClientSession
 ) -> HtmlPage:
     """Asynchronously download an HTML page (awaitable function).
 
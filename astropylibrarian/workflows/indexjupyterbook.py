@@ -16,6 +16,7 @@ from typing import TYPE_CHECKING, List, Union
 from urllib.parse import urljoin
 
 from astropylibrarian.algolia.client import generate_index_epoch
+from astropylibrarian.algolia.records import generate_date_indexed
 from astropylibrarian.reducers.jupyterbook import (
     JupyterBookMetadata,
     JupyterBookPage,
@@ -70,12 +71,14 @@ async def index_jupyterbook(
     logger.debug("Extracted JupyterBook metadata\n%s", homepage_metadata)
     page_urls = homepage_metadata.all_page_urls
     index_epoch = generate_index_epoch()
+    date_indexed = generate_date_indexed()
     tasks = [
         asyncio.create_task(
             index_jupyterbook_page(
                 url=url,
                 jupyterbook_metadata=homepage_metadata,
                 index_epoch=index_epoch,
+                date_indexed=date_indexed,
                 algolia_index=algolia_index,
                 http_client=http_client,
             )
@@ -154,7 +157,7 @@ def detect_redirect(html_page: HtmlPage) -> Union[None, str]:
     """
     doc = html_page.parse()
     # Now try to see if there is a <meta> tag with http-equiv="Refresh"
-    for element in doc.cssselect("meta"):
+    for element in doc.iter("meta"):
         try:
             if element.attrib["http-equiv"].lower() == "refresh":
                 return parse_redirect_url(
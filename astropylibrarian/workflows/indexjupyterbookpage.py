@@ -5,9 +5,11 @@ from __future__ import annotations
 
 __all__ = ["index_jupyterbook_page"]
 
+import datetime
 import logging
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional
 
+from astropylibrarian.algolia.client import save_objects_concurrent
 from astropylibrarian.reducers.jupyterbook import JupyterBookPage
 from astropylibrarian.workflows.download import download_html
 
@@ -27,25 +29,21 @@ async def index_jupyterbook_page(
     http_client: aiohttp.ClientSession,
     algolia_index: AlgoliaIndexType,
     index_epoch: str,
+    date_indexed: Optional[datetime.datetime] = None,
 ) -> List[str]:
     """Ingest a page from a JupyterBook site."""
     html_page = await download_html(url=url, http_client=http_client)
     logger.debug("Downloaded %s", url)
 
     page = JupyterBookPage(html_page)
-    records = [
-        record
-        for record in page.iter_algolia_objects(
-            site_metadata=jupyterbook_metadata, index_epoch=index_epoch
-        )
-    ]
-    logger.debug(
-        "Indexing %d records for Jupyter Book page at %s", len(records), url
+    # Records are generated lazily as they are saved
+    records = page.iter_algolia_objects(
+        site_metadata=jupyterbook_metadata,
+        index_epoch=index_epoch,
+        date_indexed=date_indexed,
     )
-    response = await algolia_index.save_objects_async(records)
-    logger.debug("Algolia save_objects: %s", response.raw_responses)
-
-    object_ids = [r["objectID"] for r in records]
+    logger.debug("Indexing records for Jupyter Book page at %s", url)
+    object_ids = await save_objects_concurrent(algolia_index, records)
 
     logger.info(
         "Finished indexing JupyterBook page: %s (%d records)",
@@ -9,13 +9,17 @@ __all__ = [
     "index_tutorial",
 ]
 
+import datetime
 import logging
 from pathlib import Path
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional
 
 import algoliasearch.exceptions
 
-from astropylibrarian.algolia.client import generate_index_epoch
+from astropylibrarian.algolia.client import (
+    generate_index_epoch,
+    save_objects_concurrent,
+)
 from astropylibrarian.reducers.tutorial import get_tutorial_reducer
 from astropylibrarian.resources import HtmlPage
 from astropylibrarian.workflows.download import download_html
@@ -35,6 +39,7 @@ async def index_tutorial_from_url(
     http_client: aiohttp.ClientSession,
     algolia_index: AlgoliaIndexType,
     priority: int,
+    date_indexed: Optional[datetime.datetime] = None,
 ) -> List[str]:
     """Asynchronously save records for a tutorial located at a URL to Algolia
     (awaitable function).
@@ -50,6 +55,10 @@ async def index_tutorial_from_url(
         `astropylibrarian.workflows.client.AlgoliaIndex` context manager.
     priority : int
         A priority level that elevates a tutorial in the UI's default sorting.
+    date_indexed : datetime.datetime, optional
+        Timestamp of the indexing run, shared by all records. Pass the same
+        timestamp when indexing several tutorials in one run. If `None`, the
+        current time is used.
 
     Returns
     -------
@@ -77,6 +86,7 @@ async def index_tutorial_from_url(
         tutorial_html=tutorial_html,
         algolia_index=algolia_index,
         priority=priority,
+        date_indexed=date_indexed,
     )
 
 
@@ -87,6 +97,7 @@ async def index_tutorial_from_path(
     http_client: aiohttp.ClientSession,
     algolia_index: AlgoliaIndexType,
     priority: int,
+    date_indexed: Optional[datetime.datetime] = None,
 ) -> List[str]:
     """Asynchronously save records for a tutorial located at a local path to
     Algolia (awaitable function).
@@ -104,6 +115,10 @@ async def index_tutorial_from_path(
         `astropylibrarian.workflows.client.AlgoliaIndex` context manager.
     priority : int
         A priority level that elevates a tutorial in the UI's default sorting.
+    date_indexed : datetime.datetime, optional
+        Timestamp of the indexing run, shared by all records. Pass the same
+        timestamp when indexing several tutorials in one run. If `None`, the
+        current time is used.
 
     Returns
     -------
@@ -128,11 +143,16 @@ async def index_tutorial_from_path(
         tutorial_html=tutorial_html,
         algolia_index=algolia_index,
         priority=priority,
+        date_indexed=date_indexed,
     )
 
 
 async def index_tutorial(
-    *, tutorial_html: HtmlPage, algolia_index: AlgoliaIndexType, priority: int
+    *,
+    tutorial_html: HtmlPage,
+    algolia_index: AlgoliaIndexType,
+    priority: int,
+    date_indexed: Optional[datetime.datetime] = None,
 ) -> List[str]:
     """Index a tutorial given a pre-loaded HTML document.
 
@@ -145,6 +165,10 @@ async def index_tutorial(
         `astropylibrarian.workflows.client.AlgoliaIndex` context manager.
     priority : int
         A priority level that elevates a tutorial in the UI's default sorting.
+    date_indexed : datetime.datetime, optional
+        Timestamp of the indexing run, shared by all records. Pass the same
+        timestamp when indexing several tutorials in one run. If `None`, the
+        current time is used.
 
     Returns
     -------
@@ -156,21 +180,16 @@ async def index_tutorial(
     tutorial = TutorialReducer(html_page=tutorial_html)
 
     index_epoch = generate_index_epoch()
-    records = [
-        r
-        for r in tutorial.iter_algolia_objects(
-            index_epoch=index_epoch, priority=priority
-        )
-    ]
-    logger.info(
-        "Indexing %d records for tutorial at %s",
-        len(records),
-        tutorial_html.url,
+    # Records are generated lazily as they are saved
+    records = tutorial.iter_algolia_objects(
+        index_epoch=index_epoch, priority=priority, date_indexed=date_indexed
     )
+    logger.info("Indexing records for tutorial at %s", tutorial_html.url)
 
-    saved_object_ids: List[str] = []
     try:
-        response = await algolia_index.save_objects_async(records)
+        saved_object_ids = await save_objects_concurrent(
+            algolia_index, records
+        )
     except algoliasearch.exceptions.RequestException as e:
         logger.error(
             "Error saving objects for tutorial %s:\n%s",
@@ -178,10 +197,6 @@ async def index_tutorial(
             str(e),
         )
         return []
-    for r in response.raw_responses:
-        _oids = r.get("objectIDs", [])
-        assert isinstance(_oids, list)
-        saved_object_ids.extend(_oids)
     logger.info(
         "Finished saving %s records for tutorial at %s",
         len(saved_object_ids),
@@ -1,9 +1,20 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 """Test the Algolia client and supporting code."""
 
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, Iterator, List, Optional, Union
+
 import pytest
+from algoliasearch.exceptions import RequestException
 
-from astropylibrarian.algolia.client import escape_facet_value
+from astropylibrarian.algolia.client import (
+    MockAlgoliaIndex,
+    MockMultiResponse,
+    escape_facet_value,
+    save_objects_concurrent,
+)
 
 
 @pytest.mark.parametrize(
@@ -16,3 +27,134 @@ from astropylibrarian.algolia.client import escape_facet_value
 )
 def test_escape_facet_value(value: str, expected: str) -> None:
     assert escape_facet_value(value) == expected
+
+
+def test_mock_save_objects_batches() -> None:
+    """MockAlgoliaIndex saves every object from an iterator, copying them
+    batch-by-batch.
+    """
+    objects = [{"objectID": str(i), "tags": [str(i)]} for i in range(25)]
+
+    async def save() -> List[Dict[str, Any]]:
+        async with MockAlgoliaIndex(
+            key="key", app_id="app", name="index", batch_size=10
+        ) as index:
+            await index.save_objects_async(iter(objects))
+            return index._saved_objects
+
+    saved_objects = asyncio.run(save())
+    assert saved_objects == objects
+    assert saved_objects[0]["tags"] is not objects[0]["tags"]
+
+
+def test_save_objects_concurrent() -> None:
+    """save_objects_concurrent returns the objectIDs of all saved objects."""
+    objects = [{"objectID": str(i)} for i in range(25)]
+
+    async def save() -> List[str]:
+        async with MockAlgoliaIndex(
+            key="key", app_id="app", name="index"
+        ) as index:
+            return await save_objects_concurrent(
+                index, iter(objects), batch_size=10, max_in_flight=2
+            )
+
+    assert sorted(asyncio.run(save())) == sorted(
+        obj["objectID"] for obj in objects
+    )
+
+
+def test_save_objects_concurrent_index_batch_size() -> None:
+    """The index's batch size is used unless batch_size is given."""
+    batch_sizes: List[int] = []
+
+    class RecordingIndex(MockAlgoliaIndex):
+        async def save_objects_async(
+            self,
+            objects: Union[List[Dict], Iterator[Dict]],
+            request_options: Optional[Dict[str, Any]] = None,
+        ) -> MockMultiResponse:
+            objects = list(objects)
+            batch_sizes.append(len(objects))
+            return await super().save_objects_async(objects)
+
+    objects = [{"objectID": str(i)} for i in range(25)]
+
+    async def save(**kwargs: Any) -> List[int]:
+        batch_sizes.clear()
+        async with RecordingIndex(
+            key="key", app_id="app", name="index", batch_size=7
+        ) as index:
+            await save_objects_concurrent(index, iter(objects), **kwargs)
+        return list(batch_sizes)
+
+    assert sorted(asyncio.run(save())) == [4, 7, 7, 7]
+    assert sorted(asyncio.run(save(batch_size=10))) == [5, 10, 10]
+
+
+def test_save_objects_concurrent_rate_limit(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Rate-limited batches are retried."""
+
+    class RateLimitedIndex(MockAlgoliaIndex):
+        calls = 0
+
+        async def save_objects_async(
+            self,
+            objects: Union[List[Dict], Iterator[Dict]],
+            request_options: Optional[Dict[str, Any]] = None,
+        ) -> MockMultiResponse:
+            self.calls += 1
+            if self.calls == 1:
+                raise RequestException("Too many requests", 429)
+            return await super().save_objects_async(objects)
+
+    async def no_sleep(delay: float) -> None:
+        pass
+
+    monkeypatch.setattr(asyncio, "sleep", no_sleep)
+
+    async def save() -> List[str]:
+        async with RateLimitedIndex(
+            key="key", app_id="app", name="index"
+        ) as index:
+            return await save_objects_concurrent(index, [{"objectID": "a"}])
+
+    assert asyncio.run(save()) == ["a"]
+
+
+def test_save_objects_concurrent_stops_after_failure() -> None:
+    """No batch requests are started after a batch request fails."""
+
+    class FailingIndex(MockAlgoliaIndex):
+        calls = 0
+
+        async def save_objects_async(
+            self,
+            objects: Union[List[Dict], Iterator[Dict]],
+            request_options: Optional[Dict[str, Any]] = None,
+        ) -> MockMultiResponse:
+            self.calls += 1
+            call = self.calls
+            await asyncio.sleep(0)
+            if call == 1:
+                raise RequestException("Bad request", 400)
+            return await super().save_objects_async(objects)
+
+    objects = [{"objectID": str(i)} for i in range(100)]
+
+    index = FailingIndex(key="key", app_id="app", name="index")
+
+    async def save() -> None:
+        async with index:
+            with pytest.raises(RequestException):
+                await save_objects_concurrent(
+                    index, iter(objects), batch_size=10, max_in_flight=2
+                )
+
+    asyncio.run(save())
+    # Only the batch that was already in flight (in the second worker) is
+    # saved after the first batch fails.
+    assert index.calls == 2
+    assert len(index._saved_objects) == 10
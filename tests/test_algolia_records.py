@@ -4,9 +4,19 @@
 from __future__ import annotations
 
 import datetime
+import json
 from typing import TYPE_CHECKING
 
+import pytest
+from pydantic import ValidationError
+
+from astropylibrarian.algolia import records
 from astropylibrarian.algolia.client import generate_index_epoch
+from astropylibrarian.algolia.records import (
+    TutorialRecord,
+    generate_date_indexed,
+    validate_index_epoch,
+)
 from astropylibrarian.reducers.jupyterbook import JupyterBookPage
 from astropylibrarian.reducers.tutorial import ReducedSphinxTutorial
 from astropylibrarian.workflows.indexjupyterbook import (
@@ -167,3 +177,224 @@ def test_guiderecord(
         "01-05-Calibration-overview_6_1.png"
     )
     assert data["priority"] == 1
+
+
+def test_tutorial_records_share_date_indexed(
+    color_excess_tutorial: HtmlTestData,
+) -> None:
+    """All records from an indexing run have the same date_indexed."""
+    reduced_tutorial = ReducedSphinxTutorial(html_page=color_excess_tutorial)
+    date_indexed = datetime.datetime(2021, 6, 1, 12, 0, 0, 1)
+
+    records = list(
+        reduced_tutorial.iter_algolia_objects(
+            index_epoch=generate_index_epoch(),
+            priority=0,
+            date_indexed=date_indexed,
+        )
+    )
+    assert len(records) > 1
+    for record in records:
+        assert record["date_indexed"] == "2021-06-01T12:00:00.000001"
+
+
+def test_export_to_algolia_matches_json(
+    color_excess_tutorial: HtmlTestData,
+) -> None:
+    """export_to_algolia produces the same object as a JSON round trip."""
+    reduced_tutorial = ReducedSphinxTutorial(html_page=color_excess_tutorial)
+    for record in reduced_tutorial.iter_records(
+        index_epoch=generate_index_epoch(), priority=0
+    ):
+        exported = record.export_to_algolia()
+        assert exported == json.loads(record.json(exclude_none=True))
+        assert type(exported["url"]) is str
+
+
+def test_export_capped_records_splits_content(
+    color_excess_tutorial: HtmlTestData,
+) -> None:
+    """Records over the size cap are split into suffixed sub-records."""
+    reduced_tutorial = ReducedSphinxTutorial(html_page=color_excess_tutorial)
+    record = max(
+        reduced_tutorial.iter_records(
+            index_epoch=generate_index_epoch(), priority=0
+        ),
+        key=lambda r: len(r.content),
+    )
+    full_object = record.export_to_algolia()
+    max_size = len(json.dumps(full_object, separators=(",", ":"))) // 2
+
+    sub_objects = list(record.export_capped_records_to_algolia(max_size))
+    assert len(sub_objects) > 1
+    assert [o["objectID"] for o in sub_objects] == [
+        f"{record.objectID}-{i}" for i in range(1, len(sub_objects) + 1)
+    ]
+    assert ". ".join(o["content"] for o in sub_objects) == record.content
+    for sub_object in sub_objects:
+        sub_object_json = json.dumps(
+            sub_object, separators=(",", ":"), ensure_ascii=False
+        )
+        assert len(sub_object_json.encode("utf-8")) < max_size
+        sub_object.pop("objectID")
+        sub_object.pop("content")
+        assert sub_object.items() <= full_object.items()
+
+
+def test_export_capped_records_without_orjson(
+    color_excess_tutorial: HtmlTestData, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Records are split the same way with and without orjson."""
+    pytest.importorskip("orjson")
+    reduced_tutorial = ReducedSphinxTutorial(html_page=color_excess_tutorial)
+    record = max(
+        reduced_tutorial.iter_records(
+            index_epoch=generate_index_epoch(), priority=0
+        ),
+        key=lambda r: len(r.content),
+    )
+    # Non-ASCII content is where escaping and UTF-8 sizes differ
+    record = record.copy(update={"content": record.content.replace("e", "é")})
+    max_size = len(json.dumps(record.export_to_algolia())) // 2
+
+    monkeypatch.setattr(records, "HAS_ORJSON", True)
+    orjson_objects = list(record.export_capped_records_to_algolia(max_size))
+    monkeypatch.setattr(records, "HAS_ORJSON", False)
+    json_objects = list(record.export_capped_records_to_algolia(max_size))
+
+    assert len(json_objects) > 1
+    assert json_objects == orjson_objects
+
+
+def test_split(color_excess_tutorial: HtmlTestData) -> None:
+    reduced_tutorial = ReducedSphinxTutorial(html_page=color_excess_tutorial)
+    record = max(
+        reduced_tutorial.iter_records(
+            index_epoch=generate_index_epoch(), priority=0
+        ),
+        key=lambda r: len(r.content),
+    )
+
+    parts = list(record.split(2))
+    assert len(parts) >= 2
+    assert [p.objectID for p in parts] == [
+        f"{record.objectID}-{i}" for i in range(1, len(parts) + 1)
+    ]
+    assert ". ".join(p.content for p in parts) == record.content
+    for part in parts:
+        assert part.url == record.url
+        assert part.h1 == record.h1
+
+
+def test_trusted_records_validate(
+    color_excess_tutorial: HtmlTestData,
+    ccd_guide_00_00: HtmlTestData,
+    ccd_guide_01_05: HtmlTestData,
+) -> None:
+    """Records built without validation by from_section would pass
+    validation unchanged.
+    """
+    tutorial = ReducedSphinxTutorial(html_page=color_excess_tutorial)
+    metadata = extract_homepage_metadata(
+        html_page=ccd_guide_00_00,
+        root_url="http://www.astropy.org/ccd-reduction-and-photometry-guide/",
+        priority=1,
+    )
+    page = JupyterBookPage(ccd_guide_01_05)
+    index_epoch = generate_index_epoch()
+    records = [
+        *tutorial.iter_records(index_epoch=index_epoch, priority=0),
+        *page.iter_records(site_metadata=metadata, index_epoch=index_epoch),
+    ]
+    for record in records:
+        validated = type(record)(**record.dict())
+        assert validated.export_to_algolia() == record.export_to_algolia()
+
+
+def test_records_are_immutable(color_excess_tutorial: HtmlTestData) -> None:
+    reduced_tutorial = ReducedSphinxTutorial(html_page=color_excess_tutorial)
+    record = next(
+        reduced_tutorial.iter_records(
+            index_epoch=generate_index_epoch(), priority=0
+        )
+    )
+    with pytest.raises(TypeError):
+        record.content = "New content"
+
+
+def test_content_type_is_constant(color_excess_tutorial: HtmlTestData) -> None:
+    reduced_tutorial = ReducedSphinxTutorial(html_page=color_excess_tutorial)
+    record = next(
+        reduced_tutorial.iter_records(
+            index_epoch=generate_index_epoch(), priority=0
+        )
+    )
+    data = record.dict()
+    data["content_type"] = "guide"
+    with pytest.raises(ValidationError):
+        TutorialRecord(**data)
+
+
+def test_generate_date_indexed() -> None:
+    """date_indexed values are naive UTC datetimes."""
+    date_indexed = generate_date_indexed()
+    assert date_indexed.tzinfo is None
+    utc_now = datetime.datetime.now(datetime.timezone.utc)
+    assert abs(
+        utc_now.replace(tzinfo=None) - date_indexed
+    ) < datetime.timedelta(minutes=1)
+
+
+def test_validate_index_epoch() -> None:
+    index_epoch = generate_index_epoch()
+    assert validate_index_epoch(index_epoch) == index_epoch
+    # Other UUID formats are normalized
+    assert validate_index_epoch(index_epoch.replace("-", "")) == index_epoch
+
+    with pytest.raises(ValueError):
+        validate_index_epoch("not-a-uuid")
+    with pytest.raises(ValueError):
+        # A UUID1, not a UUID4
+        validate_index_epoch("a8098c1a-f86e-11da-bd1a-00112444be1e")
+
+
+def test_iter_records_validates_index_epoch(
+    color_excess_tutorial: HtmlTestData,
+) -> None:
+    """Records aren't built with an invalid index_epoch."""
+    reduced_tutorial = ReducedSphinxTutorial(html_page=color_excess_tutorial)
+    with pytest.raises(ValueError):
+        next(
+            reduced_tutorial.iter_records(
+                index_epoch="a8098c1a-f86e-11da-bd1a-00112444be1e",
+                priority=0,
+            )
+        )
+
+
+@pytest.mark.parametrize("has_orjson", [True, False])
+def test_json_formatting_kwargs(
+    color_excess_tutorial: HtmlTestData,
+    monkeypatch: pytest.MonkeyPatch,
+    has_orjson: bool,
+) -> None:
+    """Formatting keyword arguments are passed through to the JSON
+    serializer.
+    """
+    if has_orjson:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr(records, "HAS_ORJSON", has_orjson)
+
+    schema_json = TutorialRecord.schema_json(indent=2)
+    assert "\n  " in schema_json
+    assert json.loads(schema_json) == TutorialRecord.schema()
+
+    reduced_tutorial = ReducedSphinxTutorial(html_page=color_excess_tutorial)
+    record = next(
+        reduced_tutorial.iter_records(
+            index_epoch=generate_index_epoch(), priority=0
+        )
+    )
+    record_json = record.json(indent=2, sort_keys=True)
+    assert "\n  " in record_json
+    assert json.loads(record_json) == json.loads(record.json())
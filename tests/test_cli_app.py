@@ -0,0 +1,25 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Tests for the astropylibrarian.cli.app module."""
+
+from __future__ import annotations
+
+import logging
+
+from astropylibrarian.cli.app import LOG_HANDLER_NAME, main_callback
+
+
+def test_main_callback_adds_one_handler() -> None:
+    logger = logging.getLogger("astropylibrarian")
+    try:
+        main_callback(verbose=0)
+        main_callback(verbose=2)
+        handlers = [
+            h for h in logger.handlers if h.get_name() == LOG_HANDLER_NAME
+        ]
+        assert len(handlers) == 1
+        assert logger.level == logging.DEBUG
+    finally:
+        for handler in list(logger.handlers):
+            if handler.get_name() == LOG_HANDLER_NAME:
+                logger.removeHandler(handler)
+        logger.setLevel(logging.NOTSET)
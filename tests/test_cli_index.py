@@ -0,0 +1,75 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Tests for the astropylibrarian.cli.index module."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+
+from astropylibrarian.algolia.client import MockAlgoliaIndex
+from astropylibrarian.cli import index as index_cli
+
+
+def test_run_index_tutorial_site(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Tutorials are indexed with bounded concurrency."""
+    for name in ("index.html", "a.html", "b.html", "c.html", "d.html"):
+        (tmp_path / name).write_text("<html></html>")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "e.html").write_text("<html></html>")
+
+    indexed_urls: List[str] = []
+    in_flight = 0
+    max_in_flight = 0
+
+    async def index_tutorial_from_path(*, url: str, **kwargs: Any) -> None:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        indexed_urls.append(url)
+        in_flight -= 1
+
+    monkeypatch.setattr(
+        index_cli, "index_tutorial_from_path", index_tutorial_from_path
+    )
+    monkeypatch.setattr(index_cli, "AlgoliaIndex", MockAlgoliaIndex)
+
+    asyncio.run(
+        index_cli.run_index_tutorial_site(
+            site_dir=tmp_path,
+            root_url="https://learn.astropy.org/tutorials/",
+            algolia_id="test",
+            algolia_key="test",
+            index="test",
+            ignore_paths=["index.html"],
+            concurrency=2,
+        )
+    )
+
+    assert sorted(indexed_urls) == [
+        "https://learn.astropy.org/tutorials/a.html",
+        "https://learn.astropy.org/tutorials/b.html",
+        "https://learn.astropy.org/tutorials/c.html",
+        "https://learn.astropy.org/tutorials/d.html",
+        "https://learn.astropy.org/tutorials/sub/e.html",
+    ]
+    assert max_in_flight == 2
+
+
+def test_iter_html_paths_skips_symlinked_dirs(tmp_path: Path) -> None:
+    """Symlinked directories are not followed (so symlink loops are safe)."""
+    (tmp_path / "a.html").write_text("<html></html>")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "b.html").write_text("<html></html>")
+    (tmp_path / "sub" / "loop").symlink_to(tmp_path, target_is_directory=True)
+
+    relative_paths = sorted(
+        relative_path
+        for _, relative_path in index_cli._iter_html_paths(tmp_path)
+    )
+    assert relative_paths == ["a.html", "sub/b.html"]
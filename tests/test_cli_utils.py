@@ -0,0 +1,41 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Tests for the astropylibrarian.cli.utils module."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any, Coroutine, List
+
+import pytest
+
+from astropylibrarian.cli import utils as cli_utils
+
+
+async def add(a: int, b: int) -> int:
+    await asyncio.sleep(0)
+    return a + b
+
+
+def test_run_async_without_uvloop(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cli_utils, "HAS_UVLOOP", False)
+    assert cli_utils.run_async(add(1, 2)) == 3
+
+
+def test_run_async_with_uvloop(monkeypatch: pytest.MonkeyPatch) -> None:
+    """uvloop runs the coroutine without installing a global policy."""
+    ran: List[Coroutine[Any, Any, Any]] = []
+
+    def run(coro: Coroutine[Any, Any, Any]) -> Any:
+        ran.append(coro)
+        return asyncio.run(coro)
+
+    policy = asyncio.get_event_loop_policy()
+    monkeypatch.setattr(cli_utils, "HAS_UVLOOP", True)
+    monkeypatch.setattr(
+        cli_utils, "uvloop", SimpleNamespace(run=run), raising=False
+    )
+
+    assert cli_utils.run_async(add(1, 2)) == 3
+    assert len(ran) == 1
+    assert asyncio.get_event_loop_policy() is policy
@@ -1,5 +1,10 @@
 """Tests for the astropylibrarian.keywords module."""
 
+from pathlib import Path
+
+import pytest
+
+import astropylibrarian.keywords
 from astropylibrarian.keywords import KeywordDb
 
 
@@ -8,6 +13,11 @@ def test_load() -> None:
     assert isinstance(keyworddb, KeywordDb)
 
 
+def test_load_cached() -> None:
+    """The built-in keyword database is only parsed once."""
+    assert KeywordDb.load() is KeywordDb.load()
+
+
 def test_get_astropy_package_keywords() -> None:
     inputs = [
         "astroquery",  # canonical keyword
@@ -55,3 +65,45 @@ def test_science_keywords() -> None:
 
     keyworddb = KeywordDb.load()
     assert keyworddb.filter_keywords(inputs, "science") == outputs
+
+
+def test_classify_keywords() -> None:
+    inputs = [
+        "astroquery",
+        "Numpy",
+        "OOP",
+        "x-ray astronomy",
+        "unknown keyword",
+    ]
+    groups = ["astropy_package", "python_package", "task", "science"]
+
+    keyworddb = KeywordDb.load()
+    classified = keyworddb.classify_keywords(inputs, groups)
+    assert classified == {
+        group: keyworddb.filter_keywords(inputs, group) for group in groups
+    }
+    assert classified["python_package"] == ["numpy"]
+
+
+def test_classify_keywords_unknown_group() -> None:
+    keyworddb = KeywordDb.load()
+    with pytest.raises(ValueError):
+        keyworddb.classify_keywords(["numpy"], ["python_package", "unknown"])
+
+
+def test_filter_keywords_normalizes_table() -> None:
+    """Keyword tables with mixed-case entries still match normalized input
+    keywords.
+    """
+    keyworddb = KeywordDb(task={"Data Analysis": ["Analysis "]})
+    assert keyworddb.filter_keywords(
+        ["data analysis", "ANALYSIS"], "task"
+    ) == ["Data Analysis", "Data Analysis"]
+
+
+def test_load_cached_by_resolved_path() -> None:
+    path = Path(astropylibrarian.keywords.__file__).parent / "data"
+    assert KeywordDb.load(path / "keywords.yaml") is KeywordDb.load(
+        path / ".." / "data" / "keywords.yaml"
+    )
+    assert KeywordDb.load(path / "keywords.yaml") is KeywordDb.load()
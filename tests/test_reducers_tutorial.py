@@ -6,9 +6,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from astropylibrarian.keywords import KeywordDb
 from astropylibrarian.reducers.tutorial import (
     ReducedNbcollectionTutorial,
     ReducedSphinxTutorial,
+    reduce_pages,
 )
 
 if TYPE_CHECKING:
@@ -200,6 +202,7 @@ def test_coordinates_transform(
     assert reduced_tutorial.images[0] == (
         "http://learn.astropy.org/_images/Coordinates-Transform_51_0.png"
     )
+    assert len(set(reduced_tutorial.images)) == len(reduced_tutorial.images)
     assert reduced_tutorial.summary == (
         "In this tutorial we demonstrate how to define astronomical "
         "coordinates using the astropy.coordinates “frame” classes. We then "
@@ -235,3 +238,42 @@ def test_nbcollection_coordinates_transform(
     ]
     assert len(reduced_tutorial.images) == 0  # all images are embedded here
     assert len(reduced_tutorial.sections) > 0
+
+
+def test_classify_keywords(color_excess_tutorial: HtmlTestData) -> None:
+    """Test ReducedTutorial.classify_keywords."""
+    reduced_tutorial = ReducedSphinxTutorial(html_page=color_excess_tutorial)
+
+    keyword_groups = reduced_tutorial.classify_keywords(KeywordDb.load())
+    assert keyword_groups == {
+        "astropy_package": [
+            "dust_extinction",
+            "synphot",
+            "astroquery",
+            "units",
+        ],
+        "python_package": [],
+        "task": ["photometry"],
+        "science": ["extinction", "physics", "observational astronomy"],
+    }
+
+
+def test_reduce_pages(
+    color_excess_tutorial: HtmlTestData,
+    nbcollection_coordinates_transform_tutorial: HtmlTestData,
+) -> None:
+    """Test reduce_pages with a process pool."""
+    pages = [
+        color_excess_tutorial,
+        nbcollection_coordinates_transform_tutorial,
+    ]
+    reduced_tutorials = list(reduce_pages(pages, workers=2))
+
+    assert isinstance(reduced_tutorials[0], ReducedSphinxTutorial)
+    assert isinstance(reduced_tutorials[1], ReducedNbcollectionTutorial)
+    for page, reduced_tutorial in zip(pages, reduced_tutorials):
+        expected = type(reduced_tutorial)(html_page=page)
+        assert reduced_tutorial.url == expected.url
+        assert reduced_tutorial.h1 == expected.h1
+        assert reduced_tutorial.keywords == expected.keywords
+        assert reduced_tutorial.sections == expected.sections
@@ -6,7 +6,14 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from astropylibrarian.reducers.utils import iter_sphinx_sections
+import lxml.html
+
+from astropylibrarian.reducers.utils import (
+    compile_first_match_selector,
+    iter_nbcollection_sections,
+    iter_sphinx_sections,
+    select_first,
+)
 
 if TYPE_CHECKING:
     from .conftest import HtmlTestData
@@ -119,3 +126,73 @@ def test_iter_sphinx_sections(color_excess_tutorial: HtmlTestData) -> None:
         "photometry",
         "Example 3: Calculate Color Excess with synphot",
     ]
+
+
+def test_iter_sphinx_sections_cell_output() -> None:
+    """Jupyter cell outputs and comments are excluded from the section
+    content, without modifying the document.
+    """
+    doc = lxml.html.document_fromstring(
+        '<html><body><div class="section" id="a"><h1>A</h1>'
+        '<div class="cell">x = 1<div class="cell_output">1</div>!</div>'
+        "<!-- comment -->"
+        "</div></body></html>"
+    )
+    root = doc.cssselect(".section")[0]
+    sections = list(
+        iter_sphinx_sections(
+            root_section=root, base_url="https://example.com", headers=[]
+        )
+    )
+    assert sections[0].content == "x = 1!"
+    assert len(doc.find_class("cell_output")) == 1
+
+
+def test_iter_nbcollection_sections() -> None:
+    """Each content element is added to its section once, with or without
+    a content callback.
+    """
+    doc = lxml.html.document_fromstring(
+        '<html><body><div class="jp-Notebook">'
+        '<div class="jp-Cell-inputWrapper"><div class="jp-RenderedHTMLCommon">'
+        '<h1 id="a">A</h1><p>Intro</p><h2 id="b">B</h2><p>One</p><p>Two</p>'
+        "</div></div>"
+        '<div class="jp-CodeCell"><div class="jp-CodeMirrorEditor">'
+        "<pre>x = 1</pre></div></div>"
+        "</div></body></html>"
+    )
+    root = doc.cssselect(".jp-Notebook")[0]
+
+    sections = list(
+        iter_nbcollection_sections(
+            root_element=root, base_url="https://example.com"
+        )
+    )
+    assert [s.headings for s in sections] == [["A"], ["A", "B"]]
+    assert sections[0].content == "Intro"
+    assert sections[1].content == "One Two x = 1"
+    assert sections[1].url == "https://example.com#b"
+
+    sections = list(
+        iter_nbcollection_sections(
+            root_element=root,
+            base_url="https://example.com",
+            content_callback=str.upper,
+        )
+    )
+    assert sections[1].content == "ONE TWO X = 1"
+
+
+def test_select_first() -> None:
+    doc = lxml.html.document_fromstring(
+        '<html><body><div class="card"><p id="a">A</p>'
+        '<div class="section"><p id="b">B</p></div></div></body></html>'
+    )
+    selector = compile_first_match_selector(".card .section p, .card p")
+    assert len(selector(doc)) == 1
+    element = select_first(selector, doc)
+    assert element is not None
+    # The first match is in document order, as with cssselect
+    assert element.attrib["id"] == "a"
+
+    assert select_first(compile_first_match_selector("#missing"), doc) is None
@@ -0,0 +1,29 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Tests for the astropylibrarian.resources module."""
+
+from __future__ import annotations
+
+import pickle
+
+from astropylibrarian.resources import HtmlPage
+
+
+def test_parse_is_cached() -> None:
+    """HtmlPage.parse returns the same document until html changes."""
+    page = HtmlPage(html="<html><h1>A</h1></html>", url="https://example.com")
+
+    doc = page.parse()
+    assert page.parse() is doc
+
+    page.html = "<html><h1>B</h1></html>"
+    assert page.parse().findtext(".//h1") == "B"
+
+
+def test_pickle_parsed_page() -> None:
+    """A parsed HtmlPage can be pickled (the cached tree is dropped)."""
+    page = HtmlPage(html="<html><h1>A</h1></html>", url="https://example.com")
+    page.parse()
+
+    copy = pickle.loads(pickle.dumps(page))
+    assert copy == page
+    assert copy.parse().findtext(".//h1") == "A"
@@ -0,0 +1,64 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Tests for the astropylibrarian.workflows.deleterooturl module."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, AsyncIterator, Dict, List
+
+from astropylibrarian.algolia.client import MockAlgoliaIndex, MockMultiResponse
+from astropylibrarian.workflows.deleterooturl import delete_root_url
+
+ROOT_URL = "https://learn.astropy.org/"
+
+
+class BrowsableMockIndex(MockAlgoliaIndex):
+    """A mock index that browses seeded records and tracks deletions."""
+
+    def __init__(self, records: List[Dict[str, Any]]) -> None:
+        super().__init__(key="key", app_id="app", name="index")
+        self.records = records
+        self.deleted_batches: List[List[str]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def browse_objects_async(
+        self, search_settings: Dict[str, Any]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        for record in self.records:
+            await asyncio.sleep(0)
+            yield record
+
+    async def delete_objects_async(
+        self, objectids: List[str]
+    ) -> MockMultiResponse:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.deleted_batches.append(list(objectids))
+        self.in_flight -= 1
+        return MockMultiResponse(raw_responses=[{"objectIDs": objectids}])
+
+
+def test_delete_root_url_batches() -> None:
+    """Records are deleted in concurrent batches while browsing."""
+    records = [{"objectID": str(i), "root_url": ROOT_URL} for i in range(25)]
+    records.append({"objectID": "other", "root_url": "https://example.com/"})
+    index = BrowsableMockIndex(records)
+
+    object_ids = asyncio.run(
+        delete_root_url(
+            root_url=ROOT_URL,
+            algolia_index=index,
+            batch_size=4,
+            max_in_flight=2,
+        )
+    )
+
+    assert object_ids == [str(i) for i in range(25)]
+    assert (
+        sorted(len(batch) for batch in index.deleted_batches) == [1] + [4] * 6
+    )
+    deleted_ids = [i for batch in index.deleted_batches for i in batch]
+    assert sorted(deleted_ids) == sorted(object_ids)
+    assert index.max_in_flight == 2